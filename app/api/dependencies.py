@@ -33,6 +33,13 @@ logger = logging.getLogger(__name__)
 # Create service instances
 yfinance_service = YFinanceService()
 
+# Shared query parameters for requests that use all defaults (models are frozen)
+DEFAULT_QUERY_PARAMS = QueryParams(
+    sort_order=SortOrder.ASC,
+    format=ResponseFormat.DEFAULT,
+    filters=None
+)
+
 
 async def get_ticker_object(
         ticker: str = Path(..., description="Stock ticker symbol", example="AAPL")
@@ -279,6 +286,16 @@ async def get_query_params(
     Returns:
         QueryParams: Query parameters model
     """
+    # Reuse the shared instance when no parameter was customized
+    if (
+            page == 1
+            and page_size == 100
+            and sort_by is None
+            and sort_order == SortOrder.ASC
+            and query_format == ResponseFormat.DEFAULT
+    ):
+        return DEFAULT_QUERY_PARAMS
+
     return QueryParams(
         page=page,
         page_size=page_size,
@@ -289,7 +306,7 @@ async def get_query_params(
     )
 
 
-def get_current_user(request: Request) -> Optional[Dict[str, any]]:
+async def get_current_user(request: Request) -> Optional[Dict[str, any]]:
     """
     Dependency to get the current user (placeholder for authentication).
 
@@ -319,7 +336,7 @@ def get_current_user(request: Request) -> Optional[Dict[str, any]]:
     return None
 
 
-def verify_api_key(request: Request) -> bool:
+async def verify_api_key(request: Request) -> bool:
     """
     Dependency to verify API key (placeholder for API key validation).
 
@@ -3,11 +3,12 @@
 This module provides common functionality and factory functions for creating
 YFinance route endpoints, reducing duplication across endpoint modules.
 """
-import functools
 import logging
-from typing import Callable, Optional, TypeVar, Dict, Any, Union, List
+import operator
+from typing import Any, Callable, Optional, TypeVar
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Path
+from starlette.concurrency import run_in_threadpool
 
 from app.core.cache import (
     cache_30_minutes,
@@ -16,23 +17,28 @@ from app.core.cache import (
     cache_1_month,
     cache_3_months
 )
+from app.core.config import settings
 from app.core.constants import (
     ENDPOINT_CACHE_DURATIONS,
     INVALIDATE_AT_MIDNIGHT
 )
-from app.api.dependencies import (
-    get_ticker_object,
-    get_market_object,
-    get_search_object,
-    get_sector_object,
-    get_industry_object
-)
+from app.services.cache_service import CacheService
 from app.services.yfinance_service import YFinanceService
 from app.utils.decorators import (
+    CACHE_EXPIRATIONS,
     error_handler,
+    orjson_response,
     performance_tracker,
     response_formatter
 )
+from app.utils.formatters import ORJSONResponse
+from app.utils.validators import (
+    validate_industry,
+    validate_market,
+    validate_search_query,
+    validate_sector,
+    validate_ticker
+)
 from app.utils.yfinance_data_manager import clean_yfinance_data
 
 # Setup logger
@@ -44,14 +50,26 @@ yfinance_service = YFinanceService()
 # Type for response models
 ResponseModel = TypeVar('ResponseModel')
 
+# Cache decorator factories keyed by duration name, except 1_day which takes
+# the midnight invalidation flag
+_DURATION_CACHE_DECORATORS = {
+    "30_minutes": cache_30_minutes,
+    "1_week": cache_1_week,
+    "1_month": cache_1_month,
+    "3_months": cache_3_months,
+}
+
 def create_ticker_router() -> APIRouter:
     """
     Create a router for ticker endpoints with standard configuration.
 
+    Ticker routes render with orjson even when the router is mounted on an
+    application that does not set it as the default response class.
+
     Returns:
         APIRouter: Configured router
     """
-    return APIRouter(prefix="/ticker", tags=["ticker"])
+    return APIRouter(prefix="/ticker", tags=["ticker"], default_response_class=ORJSONResponse)
 
 def create_market_router() -> APIRouter:
     """
@@ -110,20 +128,27 @@ def get_cache_decorator(
     if attribute_name in INVALIDATE_AT_MIDNIGHT:
         invalidate_at_midnight = True
 
-    # Select appropriate cache decorator
-    if cache_duration == "30_minutes":
-        return cache_30_minutes()
-    elif cache_duration == "1_day":
-        return cache_1_day(invalidate_at_midnight=invalidate_at_midnight)
-    elif cache_duration == "1_week":
-        return cache_1_week()
-    elif cache_duration == "1_month":
-        return cache_1_month()
-    elif cache_duration == "3_months":
-        return cache_3_months()
-    else:
-        # Default to 1 day
+    return get_duration_cache_decorator(cache_duration, invalidate_at_midnight)
+
+def get_duration_cache_decorator(
+    cache_duration: str,
+    invalidate_at_midnight: bool = False
+) -> Callable:
+    """
+    Get the cache decorator for a cache duration string.
+
+    Args:
+        cache_duration: Cache duration (30_minutes, 1_day, 1_week, 1_month, 3_months)
+        invalidate_at_midnight: Whether to invalidate at midnight (1_day only)
+
+    Returns:
+        Callable: Cache decorator
+    """
+    # Every duration except 1_day (also the default) ignores midnight invalidation
+    cache_factory = _DURATION_CACHE_DECORATORS.get(cache_duration)
+    if cache_factory is None:
         return cache_1_day(invalidate_at_midnight=invalidate_at_midnight)
+    return cache_factory()
 
 def ticker_endpoint(
     attribute_name: Optional[str] = None,
@@ -144,62 +169,113 @@ def ticker_endpoint(
         Callable: Decorator function for endpoint
     """
     def decorator(func: Callable) -> Callable:
+        # If attribute name is provided, serve the attribute through the
+        # standard stack instead of the (empty) decorated function
+        if attribute_name:
+            return _attribute_endpoint(func, attribute_name, invalidate_at_midnight, cache_duration)
+
         # Apply standard decorators
         decorated = performance_tracker()(func)
         decorated = error_handler()(decorated)
 
-        # Apply caching if attribute name is provided
-        if attribute_name:
-            if cache_duration:
-                # Use provided cache duration
-                if cache_duration == "30_minutes":
-                    decorated = cache_30_minutes()(decorated)
-                elif cache_duration == "1_day":
-                    decorated = cache_1_day(invalidate_at_midnight=invalidate_at_midnight)(decorated)
-                elif cache_duration == "1_week":
-                    decorated = cache_1_week()(decorated)
-                elif cache_duration == "1_month":
-                    decorated = cache_1_month()(decorated)
-                elif cache_duration == "3_months":
-                    decorated = cache_3_months()(decorated)
-            else:
-                # Use cache duration based on attribute name
-                decorated = get_cache_decorator(
-                    attribute_name,
-                    invalidate_at_midnight
-                )(decorated)
-
         # Apply data cleaning
         decorated = clean_yfinance_data(decorated)
 
         # Apply response formatting
-        decorated = response_formatter()(decorated)
+        return response_formatter()(decorated)
 
-        # If attribute name is provided, create a standard implementation
-        if attribute_name:
-            @functools.wraps(func)
-            async def implementation(
-                ticker_obj = Depends(get_ticker_object)
-            ):
-                """
-                Standard implementation for ticker endpoints.
+    return decorator
 
-                Args:
-                    ticker_obj: YFinance Ticker object
+def _attribute_endpoint(
+    func: Callable,
+    attribute_name: str,
+    invalidate_at_midnight: bool,
+    cache_duration: Optional[str]
+) -> Callable:
+    """
+    Build the standard implementation for a ticker attribute endpoint.
 
-                Returns:
-                    Any: Ticker attribute data
-                """
-                # Get the data from the ticker object
-                return getattr(ticker_obj, attribute_name)
+    The endpoint takes the ticker as a plain path parameter rather than the
+    get_ticker_object dependency, so the Ticker object (and its validating
+    network call) is only created on a cache miss.
 
-            # Use the standard implementation
-            return implementation
+    Args:
+        func: Placeholder endpoint function, used for naming and the cache key
+        attribute_name: YFinance attribute name
+        invalidate_at_midnight: Whether to invalidate cache at midnight
+        cache_duration: Cache duration string (overrides default based on attribute)
 
-        # Otherwise return the decorated function
-        return decorated
+    Returns:
+        Callable: Endpoint function
+    """
+    # Resolve the attribute getter once, at decoration time
+    get_attribute = operator.attrgetter(attribute_name)
+
+    async def fetch_attribute(ticker: str) -> Any:
+        # Get the data from the ticker object, off the event loop
+        return await run_in_threadpool(lambda: get_attribute(yfinance_service.get_ticker(ticker)))
+
+    # Keep the endpoint's name so cache keys and metrics stay per endpoint
+    fetch_attribute.__name__ = func.__name__
+    fetch_attribute.__qualname__ = func.__qualname__
+
+    # Apply data cleaning, caching and the standard decorators. Responses are
+    # returned unformatted so they match the declared response models.
+    if cache_duration:
+        # Use provided cache duration
+        cache_decorator = get_duration_cache_decorator(cache_duration, invalidate_at_midnight)
+    else:
+        # Use cache duration based on attribute name
+        cache_duration = ENDPOINT_CACHE_DURATIONS.get(attribute_name, "1_day")
+        cache_decorator = get_cache_decorator(attribute_name, invalidate_at_midnight)
+    decorated = clean_yfinance_data(fetch_attribute)
+    # On a cache miss, fall back to the last good result if yfinance fails
+    stale_fallback = CacheService.stale_fallback_decorator(
+        CACHE_EXPIRATIONS.get(cache_duration, settings.CACHE_1_DAY)
+    )
+    decorated = stale_fallback(decorated)
+    decorated = cache_decorator(decorated)
+    decorated = error_handler()(decorated)
+    decorated = performance_tracker()(decorated)
+
+    @orjson_response()
+    async def implementation(
+        ticker: str = Path(..., description="Stock ticker symbol", example="AAPL")
+    ):
+        # Normalize the ticker before it becomes part of the cache key
+        return await decorated(ticker=validate_ticker(ticker))
+
+    implementation.__name__ = func.__name__
+    implementation.__qualname__ = func.__qualname__
+    implementation.__doc__ = func.__doc__
+    return implementation
+
+def _attribute_fetcher(func: Callable, attribute_name: str, get_object: Callable[[str], Any]) -> Callable:
+    """
+    Build a coroutine that reads an attribute of a yfinance object.
 
-    return decorator
+    The object is looked up from the single path parameter (sector, market,
+    ...) it is called with, off the event loop, and only on a cache miss.
+
+    Args:
+        func: Placeholder endpoint function, used for naming and the cache key
+        attribute_name: YFinance attribute name
+        get_object: Service method returning the yfinance object for an identifier
+
+    Returns:
+        Callable: Coroutine function taking the path parameter as a keyword
+    """
+    # Resolve the attribute getter once, at decoration time
+    get_attribute = operator.attrgetter(attribute_name)
+
+    async def fetch_attribute(**path_params: str) -> Any:
+        (identifier,) = path_params.values()
+        return await run_in_threadpool(lambda: get_attribute(get_object(identifier)))
+
+    # Keep the endpoint's name so cache keys and metrics stay per endpoint
+    fetch_attribute.__name__ = func.__name__
+    fetch_attribute.__qualname__ = func.__qualname__
+    return fetch_attribute
 
 def market_endpoint(
     cache_duration: str = "30_minutes",
@@ -218,8 +294,12 @@ def market_endpoint(
         Callable: Decorator function for endpoint
     """
     def decorator(func: Callable) -> Callable:
+        # With an attribute name, run the attribute lookup through the stack
+        # instead of the (empty) placeholder function
+        target = _attribute_fetcher(func, attribute_name, yfinance_service.get_market) if attribute_name else func
+
         # Apply standard decorators
-        decorated = performance_tracker()(func)
+        decorated = performance_tracker()(target)
         decorated = error_handler()(decorated)
 
         # Apply caching
@@ -238,23 +318,15 @@ def market_endpoint(
 
         # If attribute name is provided, create a standard implementation
         if attribute_name:
-            @functools.wraps(func)
             async def implementation(
-                market_obj = Depends(get_market_object),
+                market: str = Path(..., description="Market identifier", example="US")
             ):
-                """
-                Standard implementation for market endpoints.
+                # Validate before the identifier becomes part of the cache key
+                return await decorated(market=validate_market(market))
 
-                Args:
-                    market_obj: YFinance Market object
-
-                Returns:
-                    Any: Market attribute data
-                """
-                # Get the data from the market object
-                return getattr(market_obj, attribute_name)
-
-            # Use the standard implementation
+            implementation.__name__ = func.__name__
+            implementation.__qualname__ = func.__qualname__
+            implementation.__doc__ = func.__doc__
             return implementation
 
         # Otherwise return the decorated function
@@ -279,8 +351,12 @@ def search_endpoint(
         Callable: Decorator function for endpoint
     """
     def decorator(func: Callable) -> Callable:
+        # With an attribute name, run the attribute lookup through the stack
+        # instead of the (empty) placeholder function
+        target = _attribute_fetcher(func, attribute_name, yfinance_service.get_search) if attribute_name else func
+
         # Apply standard decorators
-        decorated = performance_tracker()(func)
+        decorated = performance_tracker()(target)
         decorated = error_handler()(decorated)
 
         # Apply caching
@@ -297,23 +373,15 @@ def search_endpoint(
 
         # If attribute name is provided, create a standard implementation
         if attribute_name:
-            @functools.wraps(func)
             async def implementation(
-                search_obj = Depends(get_search_object),
+                query: str = Path(..., description="Search query", example="AAPL")
             ):
-                """
-                Standard implementation for search endpoints.
+                # Validate before the identifier becomes part of the cache key
+                return await decorated(query=validate_search_query(query))
 
-                Args:
-                    search_obj: YFinance Search object
-
-                Returns:
-                    Any: Search attribute data
-                """
-                # Get the data from the search object
-                return getattr(search_obj, attribute_name)
-
-            # Use the standard implementation
+            implementation.__name__ = func.__name__
+            implementation.__qualname__ = func.__qualname__
+            implementation.__doc__ = func.__doc__
             return implementation
 
         # Otherwise return the decorated function
@@ -338,9 +406,15 @@ def sector_endpoint(
         Callable: Decorator function for endpoint
     """
     def decorator(func: Callable) -> Callable:
-        # Apply standard decorators
-        decorated = performance_tracker()(func)
-        decorated = error_handler()(decorated)
+        # With an attribute name, run the attribute lookup through the stack
+        # instead of the (empty) placeholder function
+        target = _attribute_fetcher(func, attribute_name, yfinance_service.get_sector) if attribute_name else func
+
+        # Apply the standard decorators, innermost first, so that the result
+        # is formatted, cleaned, cached and then tracked like the route stack
+        # @performance_tracker @error_handler @cache @clean_yfinance_data @response_formatter
+        decorated = response_formatter()(target)
+        decorated = clean_yfinance_data(decorated)
 
         # Apply caching
         if cache_duration == "1_day":
@@ -352,31 +426,20 @@ def sector_endpoint(
         elif cache_duration == "3_months":
             decorated = cache_3_months()(decorated)
 
-        # Apply data cleaning
-        decorated = clean_yfinance_data(decorated)
-
-        # Apply response formatting
-        decorated = response_formatter()(decorated)
+        decorated = error_handler()(decorated)
+        decorated = performance_tracker()(decorated)
 
         # If attribute name is provided, create a standard implementation
         if attribute_name:
-            @functools.wraps(func)
             async def implementation(
-                sector_obj = Depends(get_sector_object),
+                sector: str = Path(..., description="Sector identifier", example="technology")
             ):
-                """
-                Standard implementation for sector endpoints.
-
-                Args:
-                    sector_obj: YFinance Sector object
-
-                Returns:
-                    Any: Sector attribute data
-                """
-                # Get the data from the sector object
-                return getattr(sector_obj, attribute_name)
+                # Validate before the identifier becomes part of the cache key
+                return await decorated(sector=validate_sector(sector))
 
-            # Use the standard implementation
+            implementation.__name__ = func.__name__
+            implementation.__qualname__ = func.__qualname__
+            implementation.__doc__ = func.__doc__
             return implementation
 
         # Otherwise return the decorated function
@@ -401,8 +464,12 @@ def industry_endpoint(
         Callable: Decorator function for endpoint
     """
     def decorator(func: Callable) -> Callable:
+        # With an attribute name, run the attribute lookup through the stack
+        # instead of the (empty) placeholder function
+        target = _attribute_fetcher(func, attribute_name, yfinance_service.get_industry) if attribute_name else func
+
         # Apply standard decorators
-        decorated = performance_tracker()(func)
+        decorated = performance_tracker()(target)
         decorated = error_handler()(decorated)
 
         # Apply caching
@@ -423,23 +490,15 @@ def industry_endpoint(
 
         # If attribute name is provided, create a standard implementation
         if attribute_name:
-            @functools.wraps(func)
             async def implementation(
-                industry_obj = Depends(get_industry_object)
+                industry: str = Path(..., description="Industry identifier", example="software")
             ):
-                """
-                Standard implementation for industry endpoints.
-
-                Args:
-                    industry_obj: YFinance Industry object
-
-                Returns:
-                    Any: Industry attribute data
-                """
-                # Get the data from the industry object
-                return getattr(industry_obj, attribute_name)
+                # Validate before the identifier becomes part of the cache key
+                return await decorated(industry=validate_industry(industry))
 
-            # Use the standard implementation
+            implementation.__name__ = func.__name__
+            implementation.__qualname__ = func.__qualname__
+            implementation.__doc__ = func.__doc__
             return implementation
 
         # Otherwise return the decorated function
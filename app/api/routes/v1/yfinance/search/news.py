@@ -1,5 +1,5 @@
 """Search news endpoint for YFinance API."""
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 
 from fastapi import Depends, Query
 
@@ -12,7 +12,7 @@ router = create_search_router()
 
 @router.get(
     "/{query}/news",
-    response_model=List[Dict[str, Any]],
+    response_model=Union[Dict[str, Any], List[Dict[str, Any]]],
     summary="Search News",
     description="Searches Yahoo Finance for news articles related to the specified query."
 )
@@ -1,5 +1,5 @@
 """Search quotes endpoint for YFinance API."""
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 
 from fastapi import Depends, Query
 
@@ -12,7 +12,7 @@ router = create_search_router()
 
 @router.get(
     "/{query}/quotes",
-    response_model=List[Dict[str, Any]],
+    response_model=Union[Dict[str, Any], List[Dict[str, Any]]],
     summary="Search Quotes",
     description="Searches Yahoo Finance for securities (stocks, ETFs, indices, etc.) matching the specified query."
 )
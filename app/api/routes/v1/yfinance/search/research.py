@@ -1,5 +1,5 @@
 """Search research endpoint for YFinance API."""
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 
 from app.api.routes.v1.yfinance.base import create_search_router, search_endpoint
 
@@ -9,7 +9,7 @@ router = create_search_router()
 
 @router.get(
     "/{query}/research",
-    response_model=List[Dict[str, Any]],
+    response_model=Union[Dict[str, Any], List[Dict[str, Any]]],
     summary="Search Research",
     description="Searches Yahoo Finance for research reports related to the specified query."
 )
@@ -1,17 +1,29 @@
 """Sector comparison endpoint for YFinance API."""
+import logging
+from operator import itemgetter
 from typing import List, Dict, Any
 
 from fastapi import Query
 
 from app.api.routes.v1.yfinance.base import create_sector_router
-from app.utils.yfinance_data_manager import clean_yfinance_data
-from app.utils.decorators import performance_tracker, error_handler, response_formatter
-from app.core.cache import cache_1_day
+from app.utils.decorators import yf_endpoint
 from app.services.yfinance_service import YFinanceService
 
+logger = logging.getLogger(__name__)
+
 # Create router for this endpoint
 router = create_sector_router()
 
+# Map of sort_by values to the sector field they sort on
+SORT_FIELDS = {
+    "name": "name",
+    "performance": "performance",
+    "market_cap": "market_cap",
+    "companies": "company_count",
+    "pe_ratio": "pe_ratio",
+    "dividend_yield": "dividend_yield",
+}
+
 
 @router.get(
     "/comparison",
@@ -19,11 +31,7 @@ router = create_sector_router()
     summary="Compare Sectors",
     description="Returns a comparison of all sectors with key performance metrics and statistics."
 )
-@performance_tracker()
-@error_handler()
-@cache_1_day()
-@clean_yfinance_data
-@response_formatter()
+@yf_endpoint(cache_duration="1_day", invalidate_at_midnight=True)
 async def get_sector_comparison(
         sort_by: str = Query("performance", description="Field to sort by (name, performance, market_cap, companies)"),
         order: str = Query("desc", description="Sort order (asc, desc)")
@@ -72,7 +80,7 @@ async def get_sector_comparison(
             }
 
             # Get overview to extract key metrics
-            overview = sector_obj.overview or {}
+            overview = yfinance_service.get_sector_overview(sector_key)
 
             # Add performance if available
             if "performance" in overview:
@@ -119,22 +127,23 @@ async def get_sector_comparison(
 
         except Exception as e:
             # Log error but continue with other sectors
-            print(f"Error processing sector {sector_key}: {str(e)}")
+            logger.warning(
+                f"Error processing sector {sector_key}: {str(e)}",
+                extra={"data": {"sector": sector_key, "error": str(e)}}
+            )
 
     # Sort the results
-    reverse = order.lower() == "desc"
-
-    if sort_by == "name":
-        comparison.sort(key=lambda x: x.get("name", ""), reverse=reverse)
-    elif sort_by == "performance":
-        comparison.sort(key=lambda x: x.get("performance", 0), reverse=reverse)
-    elif sort_by == "market_cap":
-        comparison.sort(key=lambda x: x.get("market_cap", 0), reverse=reverse)
-    elif sort_by == "companies":
-        comparison.sort(key=lambda x: x.get("company_count", 0), reverse=reverse)
-    elif sort_by == "pe_ratio":
-        comparison.sort(key=lambda x: x.get("pe_ratio", 0), reverse=reverse)
-    elif sort_by == "dividend_yield":
-        comparison.sort(key=lambda x: x.get("dividend_yield", 0), reverse=reverse)
+    sort_field = SORT_FIELDS.get(sort_by)
+    if sort_field:
+        # Annotate each entry with its sort key once, then sort in C
+        default = "" if sort_field == "name" else 0
+        for sector_data in comparison:
+            value = sector_data.get(sort_field)
+            sector_data["_sort"] = default if value is None else value
+
+        comparison.sort(key=itemgetter("_sort"), reverse=order.lower() == "desc")
+
+        for sector_data in comparison:
+            del sector_data["_sort"]
 
     return comparison
\ No newline at end of file
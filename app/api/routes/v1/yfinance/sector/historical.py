@@ -1,13 +1,12 @@
 """Sector historical data endpoint for YFinance API."""
 from typing import Dict, Any, Optional
 
-from fastapi import Depends, Query
+import numpy as np
+from fastapi import Depends, Query, Request
 
 from app.api.routes.v1.yfinance.base import create_sector_router
-from app.utils.yfinance_data_manager import clean_yfinance_data
 from app.api.dependencies import get_sector_object
-from app.utils.decorators import performance_tracker, error_handler, response_formatter
-from app.core.cache import cache_1_day
+from app.utils.decorators import conditional_etag, yf_endpoint
 from app.services.yfinance_service import YFinanceService
 
 # Create router for this endpoint
@@ -20,12 +19,10 @@ router = create_sector_router()
     summary="Get Sector Historical Data",
     description="Returns historical price and performance data for the specified sector, based on a representative ETF or index."
 )
-@performance_tracker()
-@error_handler()
-@cache_1_day()
-@clean_yfinance_data
-@response_formatter()
+@conditional_etag()
+@yf_endpoint(cache_duration="1_day", invalidate_at_midnight=True)
 async def get_sector_historical(
+        request: Request,
         sector_obj=Depends(get_sector_object),
         period: str = Query("1mo",
                             description="Time period for historical data (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)"),
@@ -40,6 +37,7 @@ async def get_sector_historical(
     Get historical performance data for a sector.
 
     Args:
+        request: FastAPI request object
         sector_obj: YFinance Sector object
         period: Time period for historical data
         interval: Data interval
@@ -113,33 +111,52 @@ async def get_sector_historical(
         sector_history = yfinance_service.get_ticker_history(sector_symbol, **history_params)
 
         if not sector_history.empty:
+            # Check the optional columns once, converting each present one to
+            # a list of Python scalars in a single pass
+            row_count = len(sector_history)
+            opens, highs, lows, close_prices = (
+                sector_history[column].to_numpy(dtype=float).tolist() if column in sector_history.columns
+                else [None] * row_count
+                for column in ("Open", "High", "Low", "Close")
+            )
+            volumes = (
+                sector_history["Volume"].to_numpy(dtype="int64").tolist() if "Volume" in sector_history.columns
+                else [None] * row_count
+            )
+
+            # Format all dates in one vectorized pass
+            dates = sector_history.index.strftime("%Y-%m-%d").tolist()
+
             # Convert history to list format
-            history_data = []
-            for date, row in sector_history.iterrows():
-                data_point = {
-                    "date": date.strftime("%Y-%m-%d"),
-                    "open": float(row["Open"]) if "Open" in row else None,
-                    "high": float(row["High"]) if "High" in row else None,
-                    "low": float(row["Low"]) if "Low" in row else None,
-                    "close": float(row["Close"]) if "Close" in row else None,
-                    "volume": int(row["Volume"]) if "Volume" in row else None,
+            history_data = [
+                {
+                    "date": date,
+                    "open": open_price,
+                    "high": high,
+                    "low": low,
+                    "close": close,
+                    "volume": volume,
                 }
-                history_data.append(data_point)
+                for date, open_price, high, low, close, volume in zip(
+                    dates, opens, highs, lows, close_prices, volumes
+                )
+            ]
 
             response["historical_data"] = history_data
 
-            # Calculate performance metrics
-            first_close = float(sector_history["Close"].iloc[0])
-            last_close = float(sector_history["Close"].iloc[-1])
-            max_close = float(sector_history["Close"].max())
-            min_close = float(sector_history["Close"].min())
+            # Calculate performance metrics on the raw close prices
+            closes = sector_history["Close"].to_numpy(dtype=float)
+            first_close = float(closes[0])
+            last_close = float(closes[-1])
+            max_close = float(np.nanmax(closes))
+            min_close = float(np.nanmin(closes))
 
             # Calculate returns
             total_return = ((last_close / first_close) - 1) * 100
 
             # Calculate volatility (standard deviation of daily returns)
-            daily_returns = sector_history["Close"].pct_change().dropna()
-            volatility = float(daily_returns.std() * 100)
+            daily_returns = np.diff(closes) / closes[:-1]
+            volatility = float(np.nanstd(daily_returns, ddof=1) * 100)
 
             # Add metrics to response
             response["performance_metrics"] = {
@@ -149,8 +166,8 @@ async def get_sector_historical(
                 "min_price": min_close,
                 "total_return": round(total_return, 2),
                 "volatility": round(volatility, 2),
-                "start_date": sector_history.index[0].strftime("%Y-%m-%d"),
-                "end_date": sector_history.index[-1].strftime("%Y-%m-%d")
+                "start_date": dates[0],
+                "end_date": dates[-1]
             }
     except Exception as e:
         response["error"] = f"Error retrieving historical data: {str(e)}"
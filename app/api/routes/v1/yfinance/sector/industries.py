@@ -1,5 +1,5 @@
 """Sector industries endpoint for YFinance API."""
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 
 from app.api.routes.v1.yfinance.base import create_sector_router, sector_endpoint
 
@@ -9,7 +9,7 @@ router = create_sector_router()
 
 @router.get(
     "/{sector}/industries",
-    response_model=List[Dict[str, Any]],
+    response_model=Union[Dict[str, Any], List[Dict[str, Any]]],
     summary="Get Sector Industries",
     description="Returns the list of industries within the specified sector."
 )
@@ -1,31 +1,44 @@
 """Sector list endpoint for YFinance API."""
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
 
 from fastapi import Depends
 
 from app.api.routes.v1.yfinance.base import create_sector_router
-from app.utils.yfinance_data_manager import clean_yfinance_data
 from app.api.dependencies import get_query_params
 from app.models.common import QueryParams
-from app.utils.decorators import performance_tracker, error_handler, response_formatter
-from app.core.cache import cache_3_months
-from app.services.yfinance_service import YFinanceService
+from app.utils.decorators import yf_endpoint
+from app.services.yfinance_service import YFinanceService, ttl_bucket
 
 # Create router for this endpoint
 router = create_sector_router()
 
 
+@lru_cache(maxsize=32)
+def _get_etf_price(symbol: str, bucket: int) -> Optional[float]:
+    """
+    Get the last price of a sector ETF, memoized per time bucket.
+
+    Args:
+        symbol: ETF ticker symbol
+        bucket: Time bucket from ttl_bucket()
+
+    Returns:
+        Optional[float]: Last price, or None if not available
+    """
+    ticker_data = YFinanceService.get_ticker_data(symbol, "fast_info")
+    if ticker_data and "last_price" in ticker_data:
+        return ticker_data.get("last_price")
+    return None
+
+
 @router.get(
     "/list",
     response_model=List[Dict[str, Any]],
     summary="List All Sectors",
     description="Returns a list of all available sectors in Yahoo Finance with their keys, names, and symbols."
 )
-@performance_tracker()
-@error_handler()
-@cache_3_months()
-@clean_yfinance_data
-@response_formatter()
+@yf_endpoint(cache_duration="3_months")
 async def list_sectors(
         query_params: QueryParams = Depends(get_query_params)
 ):
@@ -111,13 +124,13 @@ async def list_sectors(
     ]
 
     # Enrich with market cap data if possible
-    yfinance_service = YFinanceService()
+    bucket = ttl_bucket()
     for sector in sectors:
         try:
             # Try to get market cap from sector ETF
-            ticker_data = yfinance_service.get_ticker_data(sector["symbol"], "fast_info")
-            if ticker_data and "last_price" in ticker_data:
-                sector["etf_price"] = ticker_data.get("last_price")
+            etf_price = _get_etf_price(sector["symbol"], bucket)
+            if etf_price is not None:
+                sector["etf_price"] = etf_price
         except Exception:
             # Skip if we can't get the data
             pass
@@ -1,5 +1,7 @@
 """Sector metadata endpoint for YFinance API."""
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, NamedTuple, Optional
 
 from fastapi import Depends
 
@@ -12,6 +14,118 @@ from app.core.cache import cache_3_months
 # Create router for this endpoint
 router = create_sector_router()
 
+# Standard GICS sector classifications, keyed by normalized sector key
+_GICS_SECTORS: Mapping[str, Dict[str, str]] = MappingProxyType({
+    "energy": {
+        "code": "10",
+        "system": "GICS",
+        "description": "Companies that engage in exploration, production, refining, marketing, storage and transportation of oil, gas, coal and consumable fuels."
+    },
+    "materials": {
+        "code": "15",
+        "system": "GICS",
+        "description": "Companies that manufacture chemicals, construction materials, glass, paper, forest products, metals, minerals, and mining products."
+    },
+    "industrials": {
+        "code": "20",
+        "system": "GICS",
+        "description": "Companies that manufacture and distribute capital goods, provide commercial services and supplies, or provide transportation services."
+    },
+    "consumer_discretionary": {
+        "code": "25",
+        "system": "GICS",
+        "description": "Companies that provide products and services that are considered non-essential by consumers, such as automobiles, apparel, and leisure equipment."
+    },
+    "consumer_staples": {
+        "code": "30",
+        "system": "GICS",
+        "description": "Companies that provide essential products and services, such as food, beverages, tobacco, and household products."
+    },
+    "health_care": {
+        "code": "35",
+        "system": "GICS",
+        "description": "Companies that manufacture health care equipment and supplies or provide health care services, as well as companies involved in research, development, production, and marketing of pharmaceuticals and biotechnology products."
+    },
+    "financials": {
+        "code": "40",
+        "system": "GICS",
+        "description": "Companies involved in banking, thrifts and mortgage finance, diversified financial services, consumer finance, capital markets, and insurance."
+    },
+    "information_technology": {
+        "code": "45",
+        "system": "GICS",
+        "description": "Companies that offer software and IT services, manufacture communications equipment, semiconductors, and technology hardware and equipment."
+    },
+    "communication_services": {
+        "code": "50",
+        "system": "GICS",
+        "description": "Companies that provide telecommunications services and companies that provide media, entertainment, and interactive media and services."
+    },
+    "utilities": {
+        "code": "55",
+        "system": "GICS",
+        "description": "Companies that provide electric, gas, and water utilities, as well as independent power producers and energy traders, and companies that engage in generation and distribution of electricity using renewable sources."
+    },
+    "real_estate": {
+        "code": "60",
+        "system": "GICS",
+        "description": "Companies engaged in real estate development and operation, as well as companies offering real estate-related services."
+    }
+})
+
+# Display colors, keyed by normalized sector key
+_SECTOR_COLORS: Mapping[str, str] = MappingProxyType({
+    "energy": "#E74C3C",
+    "materials": "#9B59B6",
+    "industrials": "#3498DB",
+    "consumer_discretionary": "#1ABC9C",
+    "consumer_staples": "#27AE60",
+    "healthcare": "#2ECC71",
+    "health_care": "#2ECC71",
+    "financials": "#F1C40F",
+    "information_technology": "#F39C12",
+    "communication_services": "#D35400",
+    "utilities": "#BDC3C7",
+    "real_estate": "#95A5A6"
+})
+
+# Display icon names, keyed by normalized sector key
+_SECTOR_ICONS: Mapping[str, str] = MappingProxyType({
+    "energy": "zap",
+    "materials": "box",
+    "industrials": "cpu",
+    "consumer_discretionary": "shopping-cart",
+    "consumer_staples": "shopping-bag",
+    "healthcare": "heart",
+    "health_care": "heart",
+    "financials": "dollar-sign",
+    "information_technology": "code",
+    "communication_services": "message-circle",
+    "utilities": "power",
+    "real_estate": "home"
+})
+
+
+class SectorProfile(NamedTuple):
+    """Static classification and display data for a sector."""
+    color: str
+    icon: str
+    classification: Optional[Mapping[str, str]]
+
+
+# Profile for sectors missing from the tables above
+_DEFAULT_PROFILE = SectorProfile(color="#7F8C8D", icon="circle", classification=None)
+
+# Sector profiles, keyed by normalized sector key
+_SECTOR_PROFILES: Mapping[str, SectorProfile] = MappingProxyType({
+    key: SectorProfile(
+        color=_SECTOR_COLORS.get(key, _DEFAULT_PROFILE.color),
+        icon=_SECTOR_ICONS.get(key, _DEFAULT_PROFILE.icon),
+        classification=MappingProxyType(_GICS_SECTORS[key]) if key in _GICS_SECTORS else None
+    )
+    for key in {*_GICS_SECTORS, *_SECTOR_COLORS, *_SECTOR_ICONS}
+})
+
 
 @router.get(
     "/{sector}/metadata",
@@ -43,6 +157,8 @@ async def get_sector_metadata(
         "symbol": sector_obj.symbol
     }
 
+    profile = _get_sector_profile(sector_obj.key)
+
     # Add GICS classification if available
     # (GICS = Global Industry Classification Standard)
     try:
@@ -50,68 +166,8 @@ async def get_sector_metadata(
             metadata["classification"] = sector_obj.classification
         else:
             # Add standard GICS sector classification
-            gics_sectors = {
-                "energy": {
-                    "code": "10",
-                    "system": "GICS",
-                    "description": "Companies that engage in exploration, production, refining, marketing, storage and transportation of oil, gas, coal and consumable fuels."
-                },
-                "materials": {
-                    "code": "15",
-                    "system": "GICS",
-                    "description": "Companies that manufacture chemicals, construction materials, glass, paper, forest products, metals, minerals, and mining products."
-                },
-                "industrials": {
-                    "code": "20",
-                    "system": "GICS",
-                    "description": "Companies that manufacture and distribute capital goods, provide commercial services and supplies, or provide transportation services."
-                },
-                "consumer_discretionary": {
-                    "code": "25",
-                    "system": "GICS",
-                    "description": "Companies that provide products and services that are considered non-essential by consumers, such as automobiles, apparel, and leisure equipment."
-                },
-                "consumer_staples": {
-                    "code": "30",
-                    "system": "GICS",
-                    "description": "Companies that provide essential products and services, such as food, beverages, tobacco, and household products."
-                },
-                "health_care": {
-                    "code": "35",
-                    "system": "GICS",
-                    "description": "Companies that manufacture health care equipment and supplies or provide health care services, as well as companies involved in research, development, production, and marketing of pharmaceuticals and biotechnology products."
-                },
-                "financials": {
-                    "code": "40",
-                    "system": "GICS",
-                    "description": "Companies involved in banking, thrifts and mortgage finance, diversified financial services, consumer finance, capital markets, and insurance."
-                },
-                "information_technology": {
-                    "code": "45",
-                    "system": "GICS",
-                    "description": "Companies that offer software and IT services, manufacture communications equipment, semiconductors, and technology hardware and equipment."
-                },
-                "communication_services": {
-                    "code": "50",
-                    "system": "GICS",
-                    "description": "Companies that provide telecommunications services and companies that provide media, entertainment, and interactive media and services."
-                },
-                "utilities": {
-                    "code": "55",
-                    "system": "GICS",
-                    "description": "Companies that provide electric, gas, and water utilities, as well as independent power producers and energy traders, and companies that engage in generation and distribution of electricity using renewable sources."
-                },
-                "real_estate": {
-                    "code": "60",
-                    "system": "GICS",
-                    "description": "Companies engaged in real estate development and operation, as well as companies offering real estate-related services."
-                }
-            }
-
-            # Normalize a sector key
-            normalized_key = sector_obj.key.lower().replace("-", "_")
-            if normalized_key in gics_sectors:
-                metadata["classification"] = gics_sectors[normalized_key]
+            if profile.classification is not None:
+                metadata["classification"] = profile.classification
             else:
                 metadata["classification"] = {
                     "system": "GICS",
@@ -122,53 +178,29 @@ async def get_sector_metadata(
         pass
 
     # Add display information
-    metadata["display"] = {
-        "color": _get_sector_color(sector_obj.key),
-        "icon": _get_sector_icon(sector_obj.key),
-        "short_name": _get_sector_short_name(sector_obj.name)
-    }
+    metadata["display"] = _get_display_info(sector_obj.key, sector_obj.name)
 
     return metadata
 
 
-def _get_sector_color(sector_key: str) -> str:
-    """Get color for a sector."""
-    sector_colors = {
-        "energy": "#E74C3C",
-        "materials": "#9B59B6",
-        "industrials": "#3498DB",
-        "consumer-discretionary": "#1ABC9C",
-        "consumer-staples": "#27AE60",
-        "healthcare": "#2ECC71",
-        "health-care": "#2ECC71",
-        "financials": "#F1C40F",
-        "information-technology": "#F39C12",
-        "communication-services": "#D35400",
-        "utilities": "#BDC3C7",
-        "real-estate": "#95A5A6"
-    }
-    return sector_colors.get(sector_key.lower(), "#7F8C8D")
-
-
-def _get_sector_icon(sector_key: str) -> str:
-    """Get icon name for a sector."""
-    sector_icons = {
-        "energy": "zap",
-        "materials": "box",
-        "industrials": "cpu",
-        "consumer-discretionary": "shopping-cart",
-        "consumer-staples": "shopping-bag",
-        "healthcare": "heart",
-        "health-care": "heart",
-        "financials": "dollar-sign",
-        "information-technology": "code",
-        "communication-services": "message-circle",
-        "utilities": "power",
-        "real-estate": "home"
-    }
-    return sector_icons.get(sector_key.lower(), "circle")
+@lru_cache(maxsize=64)
+def _get_sector_profile(sector_key: str) -> SectorProfile:
+    """Get the profile of a sector with one normalization and one lookup."""
+    return _SECTOR_PROFILES.get(sector_key.lower().replace("-", "_"), _DEFAULT_PROFILE)
+
+
+@lru_cache(maxsize=64)
+def _get_display_info(sector_key: str, sector_name: str) -> Mapping[str, str]:
+    """Get shared, read-only display information (color, icon, short name) for a sector."""
+    profile = _get_sector_profile(sector_key)
+    return MappingProxyType({
+        "color": profile.color,
+        "icon": profile.icon,
+        "short_name": _get_sector_short_name(sector_name)
+    })
 
 
+@lru_cache(maxsize=32)
 def _get_sector_short_name(sector_name: str) -> str:
     """Get a short name for a sector."""
     if len(sector_name) <= 12:
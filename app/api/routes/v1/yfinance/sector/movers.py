@@ -1,5 +1,7 @@
 """Sector movers endpoint for YFinance API."""
-from typing import List, Dict, Any
+import heapq
+from operator import attrgetter
+from typing import List, Dict, Any, NamedTuple, Optional, Union
 from enum import Enum
 
 from fastapi import Depends, Query
@@ -9,10 +11,14 @@ from app.utils.yfinance_data_manager import clean_yfinance_data
 from app.api.dependencies import get_sector_object
 from app.utils.decorators import performance_tracker, error_handler, response_formatter
 from app.core.cache import cache_1_day
+from app.services.yfinance_service import YFinanceService
 
 # Create router for this endpoint
 router = create_sector_router()
 
+# Fields a company needs to be ranked as a mover
+_REQUIRED_MOVER_FIELDS = frozenset({'symbol', 'shortName', 'regularMarketPrice', 'regularMarketChangePercent'})
+
 
 class MoverType(str, Enum):
     """Enum for market mover types."""
@@ -21,9 +27,20 @@ class MoverType(str, Enum):
     ACTIVE = "active"
 
 
+class Mover(NamedTuple):
+    """A ranked mover candidate; only the selected ones are turned into dicts."""
+    symbol: str
+    name: str
+    price: float
+    change: Optional[float]
+    percent_change: float
+    volume: Optional[int]
+    market_cap: Optional[int]
+
+
 @router.get(
     "/{sector}/movers",
-    response_model=List[Dict[str, Any]],
+    response_model=Union[Dict[str, Any], List[Dict[str, Any]]],
     summary="Get Sector Movers",
     description="Returns the top gainers, losers, or most active securities within the specified sector."
 )
@@ -48,55 +65,39 @@ async def get_sector_movers(
     Returns:
         List[Dict[str, Any]]: List of sector movers
     """
-    # Get top companies in the sector
-    companies = sector_obj.top_companies
+    # Get top companies in the sector as a list of records
+    companies = YFinanceService.top_list_records(sector_obj.top_companies)
 
-    # Filter out companies with missing data
-    filtered_companies = []
-    for company in companies:
+    # Filter out companies with missing data and format them in a single pass
+    candidates = (
+        _format_mover(company)
+        for company in companies
         # Ensure we have the required fields
-        if all(field in company for field in
-               ['symbol', 'shortName', 'regularMarketPrice', 'regularMarketChangePercent']):
-            filtered_companies.append(company)
-
-    # Sort based on mover type
-    if mover_type == MoverType.GAINERS:
-        filtered_companies.sort(
-            key=lambda x: x.get('regularMarketChangePercent', 0),
-            reverse=True
-        )
-    elif mover_type == MoverType.LOSERS:
-        filtered_companies.sort(
-            key=lambda x: x.get('regularMarketChangePercent', 0)
-        )
+        if _REQUIRED_MOVER_FIELDS <= company.keys()
+    )
+
+    # Select the top movers based on mover type (heap selection, no full sort)
+    if mover_type == MoverType.LOSERS:
+        movers = heapq.nsmallest(count, candidates, key=attrgetter('percent_change'))
     elif mover_type == MoverType.ACTIVE:
-        # Sort by trading volume if available, otherwise by market cap
-        if any('regularMarketVolume' in company for company in filtered_companies):
-            filtered_companies.sort(
-                key=lambda x: x.get('regularMarketVolume', 0),
-                reverse=True
-            )
-        else:
-            filtered_companies.sort(
-                key=lambda x: x.get('marketCap', 0),
-                reverse=True
-            )
-
-    # Limit to requested count
-    movers = filtered_companies[:count]
-
-    # Format the response
-    formatted_movers = []
-    for company in movers:
-        formatted_company = {
-            "symbol": company.get('symbol'),
-            "name": company.get('shortName', company.get('longName', company.get('symbol'))),
-            "price": company.get('regularMarketPrice'),
-            "change": company.get('regularMarketChange'),
-            "percent_change": company.get('regularMarketChangePercent'),
-            "volume": company.get('regularMarketVolume'),
-            "market_cap": company.get('marketCap')
-        }
-        formatted_movers.append(formatted_company)
-
-    return formatted_movers
\ No newline at end of file
+        # Rank by trading volume, falling back to market cap when volume is missing
+        movers = heapq.nlargest(count, candidates, key=lambda x: (x.volume or 0, x.market_cap or 0))
+    else:
+        movers = heapq.nlargest(count, candidates, key=attrgetter('percent_change'))
+
+    return [mover._asdict() for mover in movers]
+
+
+def _format_mover(company: Dict[str, Any]) -> Mover:
+    """Build a mover candidate from a company that has all the required fields."""
+    get = company.get
+    symbol = company['symbol']
+    return Mover(
+        symbol,
+        company['shortName'] or get('longName') or symbol,
+        company['regularMarketPrice'],
+        get('regularMarketChange'),
+        company['regularMarketChangePercent'],
+        get('regularMarketVolume'),
+        get('marketCap')
+    )
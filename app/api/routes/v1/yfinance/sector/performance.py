@@ -1,7 +1,10 @@
 """Sector performance endpoint for YFinance API."""
+import asyncio
 from typing import Dict, Any
 
+import numpy as np
 from fastapi import Depends, Query
+from starlette.concurrency import run_in_threadpool
 
 from app.api.routes.v1.yfinance.base import create_sector_router
 from app.utils.yfinance_data_manager import clean_yfinance_data
@@ -13,6 +16,9 @@ from app.services.yfinance_service import YFinanceService
 # Create router for this endpoint
 router = create_sector_router()
 
+# Create service instance
+yfinance_service = YFinanceService()
+
 
 @router.get(
     "/{sector}/performance",
@@ -39,11 +45,8 @@ async def get_sector_performance(
     Returns:
         Dict[str, Any]: Performance metrics for the sector
     """
-    # Create YFinance service
-    yfinance_service = YFinanceService()
-
-    # Get sector overview to extract key information
-    overview = sector_obj.overview or {}
+    # Get sector overview to extract key information (shared in-process cache)
+    overview = yfinance_service.get_sector_overview(sector_obj.key)
     performance = {"key": sector_obj.key, "name": sector_obj.name, "symbol": sector_obj.symbol}
 
     # Extract performance from overview if available
@@ -66,61 +69,83 @@ async def get_sector_performance(
     # Get sector symbol for historical data if available
     sector_symbol = sector_obj.symbol
 
+    # Use S&P 500 as market benchmark
+    market_symbol = "^GSPC"
+
+    # Fetch sector and benchmark history concurrently, off the event loop
+    symbols = [sector_symbol, market_symbol] if sector_symbol else [market_symbol]
+    histories = await asyncio.gather(
+        *(
+            run_in_threadpool(yfinance_service.get_ticker_history, symbol, period=period, interval="1d")
+            for symbol in symbols
+        ),
+        return_exceptions=True
+    )
+    history = histories[0] if sector_symbol else None
+    market_history = histories[-1]
+
     if sector_symbol:
         try:
-            # Get historical data for a specified period
-            history = yfinance_service.get_ticker_history(sector_symbol, period=period, interval="1d")
+            if isinstance(history, Exception):
+                raise history
 
             if not history.empty:
+                # Extract the price columns once as NumPy arrays
+                closes = history['Close'].to_numpy(dtype=float)
+                highs = history['High'].to_numpy(dtype=float)
+                lows = history['Low'].to_numpy(dtype=float)
+                # Format all dates in one vectorized pass
+                dates = history.index.strftime('%Y-%m-%d')
+
                 # Calculate performance metrics
-                first_close = history['Close'].iloc[0]
-                last_close = history['Close'].iloc[-1]
+                first_close = closes[0]
+                last_close = closes[-1]
                 total_return = ((last_close / first_close) - 1) * 100
 
                 # Calculate high/low metrics
-                high = history['High'].max()
-                high_date = history.loc[history['High'].idxmax()].name.strftime('%Y-%m-%d')
-                low = history['Low'].min()
-                low_date = history.loc[history['Low'].idxmin()].name.strftime('%Y-%m-%d')
+                high_idx = np.nanargmax(highs)
+                low_idx = np.nanargmin(lows)
 
-                # Calculate volatility
-                volatility = history['Close'].pct_change().std() * 100
+                # Calculate volatility (sample std of daily returns)
+                daily_returns = np.diff(closes) / closes[:-1]
+                volatility = np.nanstd(daily_returns, ddof=1) * 100
 
                 # Add historical performance data
                 performance["historical"] = {
                     "period": period,
                     "total_return": round(total_return, 2),
-                    "start_date": history.index[0].strftime('%Y-%m-%d'),
-                    "end_date": history.index[-1].strftime('%Y-%m-%d'),
+                    "start_date": dates[0],
+                    "end_date": dates[-1],
                     "start_value": round(first_close, 2),
                     "end_value": round(last_close, 2),
-                    "high": round(high, 2),
-                    "high_date": high_date,
-                    "low": round(low, 2),
-                    "low_date": low_date,
+                    "high": round(highs[high_idx], 2),
+                    "high_date": dates[high_idx],
+                    "low": round(lows[low_idx], 2),
+                    "low_date": dates[low_idx],
                     "volatility": round(volatility, 2)
                 }
 
                 # Calculate drawdowns (periods of decline from peak)
-                rolling_max = history['Close'].cummax()
-                drawdown = (history['Close'] / rolling_max - 1) * 100
-                max_drawdown = drawdown.min()
-                max_drawdown_date = history.loc[drawdown.idxmin()].name.strftime('%Y-%m-%d')
+                drawdown = (closes / np.fmax.accumulate(closes) - 1) * 100
+                max_drawdown_idx = np.nanargmin(drawdown)
 
-                performance["historical"]["max_drawdown"] = round(max_drawdown, 2)
-                performance["historical"]["max_drawdown_date"] = max_drawdown_date
+                performance["historical"]["max_drawdown"] = round(drawdown[max_drawdown_idx], 2)
+                performance["historical"]["max_drawdown_date"] = dates[max_drawdown_idx]
 
         except Exception as e:
             # Log error but continue
             performance["historical_error"] = f"Error retrieving historical data: {str(e)}"
 
+    # Relative performance needs sector history, so stop early without it
+    if history is None or isinstance(history, Exception) or len(history) == 0:
+        return performance
+
     # Get relative performance compared to market
     try:
-        # Use S&P 500 as market benchmark
-        market_symbol = "^GSPC"
-        market_history = yfinance_service.get_ticker_history(market_symbol, period=period, interval="1d")
+        if isinstance(market_history, Exception):
+            raise market_history
 
-        if not market_history.empty and not history.empty:
+        if not market_history.empty:
             # Calculate sector and market returns
             sector_return = ((history['Close'].iloc[-1] / history['Close'].iloc[0]) - 1) * 100
             market_return = ((market_history['Close'].iloc[-1] / market_history['Close'].iloc[0]) - 1) * 100
@@ -1,7 +1,9 @@
 """Sector rankings endpoint for YFinance API."""
-from typing import List, Dict, Any
+from operator import itemgetter
+from typing import Any, Awaitable, Callable, Dict, List
 
 from fastapi import Query
+from starlette.concurrency import run_in_threadpool
 
 from app.api.routes.v1.yfinance.base import create_sector_router
 from app.utils.yfinance_data_manager import clean_yfinance_data
@@ -12,6 +14,24 @@ from app.services.yfinance_service import YFinanceService
 # Create router for this endpoint
 router = create_sector_router()
 
+# Create service instance
+yfinance_service = YFinanceService()
+
+# Sector names and the ETFs used as their proxies, as parallel tuples
+_SECTOR_NAMES = (
+    "Technology",
+    "Financial",
+    "Healthcare",
+    "Consumer Cyclical",
+    "Consumer Defensive",
+    "Energy",
+    "Industrials",
+    "Basic Materials",
+    "Utilities",
+    "Real Estate",
+    "Communication Services",
+)
+_SECTOR_ETF_SYMBOLS = ("XLK", "XLF", "XLV", "XLY", "XLP", "XLE", "XLI", "XLB", "XLU", "XLRE", "XLC")
 
 @router.get(
     "/rankings",
@@ -40,94 +60,141 @@ async def get_sector_rankings(
     Returns:
         List[Dict[str, Any]]: Ranked list of sectors
     """
-    # Create YFinance service
-    yfinance_service = YFinanceService()
-
-    # Sector ETFs mapping for getting sector data
-    sector_etfs = {
-        "Technology": {"symbol": "XLK", "name": "Technology"},
-        "Financial": {"symbol": "XLF", "name": "Financial Services"},
-        "Healthcare": {"symbol": "XLV", "name": "Healthcare"},
-        "Consumer Cyclical": {"symbol": "XLY", "name": "Consumer Cyclical"},
-        "Consumer Defensive": {"symbol": "XLP", "name": "Consumer Defensive"},
-        "Energy": {"symbol": "XLE", "name": "Energy"},
-        "Industrials": {"symbol": "XLI", "name": "Industrials"},
-        "Basic Materials": {"symbol": "XLB", "name": "Basic Materials"},
-        "Utilities": {"symbol": "XLU", "name": "Utilities"},
-        "Real Estate": {"symbol": "XLRE", "name": "Real Estate"},
-        "Communication Services": {"symbol": "XLC", "name": "Communication Services"}
-    }
+    # Dispatch to the implementation specialized for the metric
+    rank_sectors = _RANKING_IMPLS.get(metric, _RANKING_IMPLS["performance"])
+    return await rank_sectors(period, order.lower() == "desc")
 
-    # Collect data for each sector
-    sectors_data = []
-
-    for sector_name, info in sector_etfs.items():
-        try:
-            etf_symbol = info["symbol"]
-
-            # Get ETF data as proxy for sector
-            ticker_info = yfinance_service.get_ticker_data(etf_symbol, "info")
-
-            if not ticker_info:
-                continue
-
-            # Get historical data for performance calculation
-            if metric == "performance":
-                history = yfinance_service.get_ticker_history(etf_symbol, period=period)
-
-                if history.empty:
-                    continue
-
-                # Calculate performance
-                first_close = history['Close'].iloc[0]
-                last_close = history['Close'].iloc[-1]
-                performance = ((last_close / first_close) - 1) * 100
-
-                sector_data = {
-                    "name": sector_name,
-                    "performance": round(performance, 2),
-                    "period": period,
-                    "start_price": round(first_close, 2),
-                    "current_price": round(last_close, 2),
-                    "symbol": etf_symbol
-                }
-            else:
-                # Extract other metrics
-                sector_data = {
-                    "name": sector_name,
-                    "symbol": etf_symbol,
-                    "price": ticker_info.get("regularMarketPrice"),
-                    "market_cap": ticker_info.get("marketCap"),
-                    "volume": ticker_info.get("volume"),
-                    "pe_ratio": ticker_info.get("trailingPE"),
-                    "dividend_yield": ticker_info.get("dividendYield", 0) * 100 if ticker_info.get(
-                        "dividendYield") else 0,
-                }
-
-            sectors_data.append(sector_data)
-
-        except Exception:
-            # Skip sectors with errors
-            continue
 
-    # Sort by selected metric
-    if metric == "performance":
-        sort_key = "performance"
-    elif metric in ["market_cap", "volume", "pe_ratio", "dividend_yield"]:
-        sort_key = metric
-    else:
-        sort_key = "performance"
-
-    # Apply sorting
-    reverse_order = order.lower() == "desc"
-    sorted_sectors = sorted(
-        sectors_data,
-        key=lambda x: x.get(sort_key, 0) if x.get(sort_key) is not None else 0,
-        reverse=reverse_order
+async def _load_sector_performance(period: str) -> List[Dict[str, Any]]:
+    """
+    Load performance data for all sector ETFs.
+
+    Args:
+        period: Time period for performance metrics
+
+    Returns:
+        List[Dict[str, Any]]: Sector data for ETFs that have history
+    """
+    # Download all sector ETF histories in one batch
+    history = await run_in_threadpool(
+        yfinance_service.get_multi_history, list(_SECTOR_ETF_SYMBOLS), period=period
     )
+    return _compute_sector_performance(history, period)
+
+
+async def _load_sector_quotes(period: str) -> List[Dict[str, Any]]:
+    """
+    Load quote metrics for all sector ETFs.
+
+    Args:
+        period: Time period for performance metrics (unused by quote metrics)
+
+    Returns:
+        List[Dict[str, Any]]: Sector data for ETFs that have a quote
+    """
+    # Get quotes for all sector ETFs in a single request
+    quotes = await run_in_threadpool(yfinance_service.get_quote_batch, list(_SECTOR_ETF_SYMBOLS))
+
+    return [
+        _format_sector_quote(sector_name, etf_symbol, quotes[etf_symbol])
+        for sector_name, etf_symbol in zip(_SECTOR_NAMES, _SECTOR_ETF_SYMBOLS)
+        if quotes.get(etf_symbol)
+    ]
+
+
+def _make_ranking_impl(
+        load_sectors: Callable[[str], Awaitable[List[Dict[str, Any]]]],
+        field: str
+) -> Callable[[str, bool], Awaitable[List[Dict[str, Any]]]]:
+    """
+    Build a ranking implementation specialized for one metric.
+
+    Args:
+        load_sectors: Coroutine function loading the sector data for the metric
+        field: Sector data field to rank by; missing values rank as 0
+
+    Returns:
+        Callable[[str, bool], Awaitable[List[Dict[str, Any]]]]: Ranking coroutine
+            function taking the period and whether to sort in descending order
+    """
+    async def rank_sectors(period: str, reverse: bool) -> List[Dict[str, Any]]:
+        # Extract the sort values once and sort on them with a C-level key
+        indexed = [(sector.get(field) or 0, sector) for sector in await load_sectors(period)]
+        indexed.sort(key=itemgetter(0), reverse=reverse)
+
+        # Add rank
+        sorted_sectors = []
+        for i, (_, sector) in enumerate(indexed, start=1):
+            sector["rank"] = i
+            sorted_sectors.append(sector)
+
+        return sorted_sectors
+
+    return rank_sectors
+
+
+def _compute_sector_performance(history: Dict[str, List[Dict[str, Any]]], period: str) -> List[Dict[str, Any]]:
+    """
+    Compute the performance of every sector ETF from a batched history.
+
+    Args:
+        history: Historical records per ETF symbol
+        period: Time period for performance metrics
+
+    Returns:
+        List[Dict[str, Any]]: Sector data for ETFs that have history
+    """
+    sectors = []
+    for sector_name, etf_symbol in zip(_SECTOR_NAMES, _SECTOR_ETF_SYMBOLS):
+        # First and last available close; skip ETFs without history
+        closes = [row["Close"] for row in history.get(etf_symbol, ()) if row.get("Close") is not None]
+        if not closes:
+            continue
+
+        first_close, last_close = closes[0], closes[-1]
+        performance = (last_close / first_close - 1.0) * 100.0
+        sectors.append({
+            "name": sector_name,
+            "performance": round(performance, 2),
+            "period": period,
+            "start_price": round(first_close, 2),
+            "current_price": round(last_close, 2),
+            "symbol": etf_symbol
+        })
+
+    return sectors
+
+
+def _format_sector_quote(sector_name: str, etf_symbol: str, quote: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract ranking metrics from a sector ETF quote.
+
+    Args:
+        sector_name: Sector name
+        etf_symbol: Symbol of the ETF used as proxy for the sector
+        quote: Quote row for the ETF
+
+    Returns:
+        Dict[str, Any]: Sector data
+    """
+    dividend_yield = quote.get("trailingAnnualDividendYield")
+
+    return {
+        "name": sector_name,
+        "symbol": etf_symbol,
+        "price": quote.get("regularMarketPrice"),
+        "market_cap": quote.get("marketCap"),
+        "volume": quote.get("regularMarketVolume"),
+        "pe_ratio": quote.get("trailingPE"),
+        "dividend_yield": dividend_yield * 100 if dividend_yield else 0,
+    }
 
-    # Add rank
-    for i, sector in enumerate(sorted_sectors):
-        sector["rank"] = i + 1
 
-    return sorted_sectors
\ No newline at end of file
+# Ranking implementation for each supported metric
+_RANKING_IMPLS = {
+    "performance": _make_ranking_impl(_load_sector_performance, "performance"),
+    "market_cap": _make_ranking_impl(_load_sector_quotes, "market_cap"),
+    "volume": _make_ranking_impl(_load_sector_quotes, "volume"),
+    "pe_ratio": _make_ranking_impl(_load_sector_quotes, "pe_ratio"),
+    "dividend_yield": _make_ranking_impl(_load_sector_quotes, "dividend_yield"),
+}
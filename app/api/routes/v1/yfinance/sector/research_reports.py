@@ -1,5 +1,5 @@
 """Sector research reports endpoint for YFinance API."""
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 
 from app.api.routes.v1.yfinance.base import create_sector_router, sector_endpoint
 
@@ -8,7 +8,7 @@ router = create_sector_router()
 
 @router.get(
     "/{sector}/research-reports",
-    response_model=List[Dict[str, Any]],
+    response_model=Union[Dict[str, Any], List[Dict[str, Any]]],
     summary="Get Sector Research Reports",
     description="Returns research reports for the specified sector."
 )
@@ -1,7 +1,10 @@
 """Sector stocks endpoint for YFinance API."""
-from typing import List, Dict, Any
+import asyncio
+import heapq
+from typing import List, Dict, Any, Optional
 
 from fastapi import Depends, Query
+from starlette.concurrency import run_in_threadpool
 
 from app.api.routes.v1.yfinance.base import create_sector_router
 from app.utils.yfinance_data_manager import clean_yfinance_data
@@ -13,6 +16,23 @@ from app.services.yfinance_service import YFinanceService
 # Create router for this endpoint
 router = create_sector_router()
 
+# Create service instance
+yfinance_service = YFinanceService()
+
+# Maximum number of ticker info requests in flight per call
+MAX_CONCURRENT_INFO_REQUESTS = 16
+
+# Sort key for each supported sort field, treating missing values as the lowest
+# (or, for P/E, the highest) possible value
+_STOCK_SORT_KEYS = {
+    "market_cap": lambda x: x.get("market_cap") or 0,
+    "price": lambda x: x.get("price") or 0,
+    "change": lambda x: x.get("percent_change") or 0,
+    "name": lambda x: x.get("name") or "",
+    "pe_ratio": lambda x: x.get("pe_ratio") if x.get("pe_ratio") is not None else float('inf'),
+    "dividend_yield": lambda x: x.get("dividend_yield") or 0,
+}
+
 
 @router.get(
     "/{sector}/stocks",
@@ -51,16 +71,13 @@ async def get_sector_stocks(
     Returns:
         List[Dict[str, Any]]: List of stocks in the sector
     """
-    # Create YFinance service
-    yfinance_service = YFinanceService()
-
     # First, try to get top companies as a starting point
-    companies = sector_obj.top_companies or []
+    companies = yfinance_service.top_list_records(sector_obj.top_companies)
 
-    # Initialize a stock list
+    # Build stocks from the company data and apply the filters that need nothing else
     stocks = []
+    mcap_threshold = (min_market_cap or 0) * 1e9
 
-    # Process and filter companies
     for company in companies:
         # Skip if missing essential data
         if not company.get('symbol'):
@@ -77,70 +94,112 @@ async def get_sector_stocks(
             "industry": company.get('industry')
         }
 
-        # Try to get additional data from ticker info
-        try:
-            symbol = company.get('symbol')
-            ticker_info = yfinance_service.get_ticker_data(symbol, 'info')
-
-            if ticker_info:
-                # Add country if available
-                if 'country' in ticker_info:
-                    stock['country'] = ticker_info.get('country')
-
-                # Add PE ratio if available
-                if 'trailingPE' in ticker_info:
-                    stock['pe_ratio'] = ticker_info.get('trailingPE')
-
-                # Add dividend yield if available
-                if 'dividendYield' in ticker_info:
-                    dividend_yield = ticker_info.get('dividendYield')
-                    if dividend_yield is not None:
-                        stock['dividend_yield'] = dividend_yield * 100  # Convert to percentage
-
-                # Add volume if available
-                if 'volume' in ticker_info:
-                    stock['volume'] = ticker_info.get('volume')
-        except Exception:
-            # Continue if we can't get additional data
-            pass
+        if min_market_cap is not None and (stock['market_cap'] or 0) < mcap_threshold:
+            continue
 
-        # Apply filters
-        if min_market_cap is not None:
-            if 'market_cap' not in stock or stock.get('market_cap', 0) < (min_market_cap * 1e9):
-                continue
+        stocks.append(stock)
 
-        if max_pe is not None:
-            if 'pe_ratio' not in stock or stock.get('pe_ratio', float('inf')) > max_pe:
-                continue
+    reverse = order.lower() == "desc"
 
-        if min_dividend_yield is not None:
-            if 'dividend_yield' not in stock or stock.get('dividend_yield', 0) < min_dividend_yield:
-                continue
+    # Without filters or sorting on ticker info fields, only the returned stocks need their info
+    needs_info = (
+        max_pe is not None
+        or min_dividend_yield is not None
+        or country is not None
+        or sort_by in ("pe_ratio", "dividend_yield")
+    )
+    if not needs_info:
+        stocks = _top_stocks(stocks, sort_by, reverse, limit)
+
+    # Fetch additional ticker info for the remaining stocks concurrently
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_INFO_REQUESTS)
+    infos = await asyncio.gather(
+        *(_get_ticker_info(stock["symbol"], semaphore) for stock in stocks)
+    )
+
+    filtered_stocks = []
+    country_lower = country.lower() if country is not None else None
+
+    for stock, ticker_info in zip(stocks, infos):
+        # Add additional data from ticker info
+        if ticker_info:
+            # Add country if available
+            if 'country' in ticker_info:
+                stock['country'] = ticker_info.get('country')
+
+            # Add PE ratio if available
+            if 'trailingPE' in ticker_info:
+                stock['pe_ratio'] = ticker_info.get('trailingPE')
+
+            # Add dividend yield if available
+            if 'dividendYield' in ticker_info:
+                dividend_yield = ticker_info.get('dividendYield')
+                if dividend_yield is not None:
+                    stock['dividend_yield'] = dividend_yield * 100  # Convert to percentage
+
+            # Add volume if available
+            if 'volume' in ticker_info:
+                stock['volume'] = ticker_info.get('volume')
+
+        # Apply filters, reading each field once
+        pe_ratio = stock.get('pe_ratio')
+        dividend_yield = stock.get('dividend_yield')
+        stock_country = stock.get('country')
+
+        pe_ok = max_pe is None or (pe_ratio is not None and pe_ratio <= max_pe)
+        dy_ok = min_dividend_yield is None or (dividend_yield is not None and dividend_yield >= min_dividend_yield)
+        country_ok = country is None or (stock_country is not None and stock_country.lower() == country_lower)
+
+        if not (pe_ok and dy_ok and country_ok):
+            continue
 
-        if country is not None:
-            if 'country' not in stock or stock.get('country', '').lower() != country.lower():
-                continue
+        filtered_stocks.append(stock)
 
-        stocks.append(stock)
+    # Sort and limit the results
+    stocks = _top_stocks(filtered_stocks, sort_by, reverse, limit)
 
-    # Sort the results
-    reverse = order.lower() == "desc"
+    return stocks
+
+
+def _top_stocks(
+        stocks: List[Dict[str, Any]],
+        sort_by: str,
+        reverse: bool,
+        limit: int
+) -> List[Dict[str, Any]]:
+    """
+    Select the first stocks in the requested order.
+
+    Args:
+        stocks: Stocks to select from
+        sort_by: Field to sort by
+        reverse: Whether to sort in descending order
+        limit: Maximum number of stocks to return
 
-    if sort_by == "market_cap":
-        stocks.sort(key=lambda x: x.get("market_cap", 0), reverse=reverse)
-    elif sort_by == "price":
-        stocks.sort(key=lambda x: x.get("price", 0), reverse=reverse)
-    elif sort_by == "change":
-        stocks.sort(key=lambda x: x.get("percent_change", 0), reverse=reverse)
-    elif sort_by == "name":
-        stocks.sort(key=lambda x: x.get("name", ""), reverse=reverse)
-    elif sort_by == "pe_ratio":
-        stocks.sort(key=lambda x: x.get("pe_ratio", float('inf')), reverse=reverse)
-    elif sort_by == "dividend_yield":
-        stocks.sort(key=lambda x: x.get("dividend_yield", 0), reverse=reverse)
-
-    # Limit the results
-    if len(stocks) > limit:
-        stocks = stocks[:limit]
-
-    return stocks
\ No newline at end of file
+    Returns:
+        List[Dict[str, Any]]: The selected stocks, in order
+    """
+    sort_key = _STOCK_SORT_KEYS.get(sort_by, _STOCK_SORT_KEYS["market_cap"])
+
+    if reverse:
+        return heapq.nlargest(limit, stocks, key=sort_key)
+    return heapq.nsmallest(limit, stocks, key=sort_key)
+
+
+async def _get_ticker_info(symbol: str, semaphore: asyncio.Semaphore) -> Optional[Dict[str, Any]]:
+    """
+    Fetch ticker info off the event loop, bounded by a semaphore.
+
+    Args:
+        symbol: Ticker symbol
+        semaphore: Semaphore limiting concurrent requests
+
+    Returns:
+        Optional[Dict[str, Any]]: Ticker info, or None if it cannot be retrieved
+    """
+    async with semaphore:
+        try:
+            return await run_in_threadpool(yfinance_service.get_ticker_data, symbol, 'info')
+        except Exception:
+            # Continue if we can't get additional data
+            return None
@@ -2,6 +2,7 @@
 from typing import Dict, Any
 
 from fastapi import Depends
+from starlette.concurrency import run_in_threadpool
 
 from app.api.routes.v1.yfinance.base import create_sector_router
 from app.utils.yfinance_data_manager import clean_yfinance_data
@@ -13,6 +14,9 @@ from app.services.yfinance_service import YFinanceService
 # Create router for this endpoint
 router = create_sector_router()
 
+# Create service instance
+yfinance_service = YFinanceService()
+
 
 @router.get(
     "/{sector}/ticker",
@@ -49,11 +53,8 @@ async def get_sector_ticker(
             "sector": sector_obj.name
         }
 
-    # Create service
-    yfinance_service = YFinanceService()
-
-    # Get ticker information
-    ticker_info = yfinance_service.get_ticker_data(symbol, 'info')
+    # Get ticker information off the event loop
+    ticker_info = await run_in_threadpool(yfinance_service.get_ticker_data, symbol, 'info')
 
     # Add sector context
     result = {
@@ -1,25 +1,29 @@
 """Sector top companies endpoint for YFinance API."""
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 
 from fastapi import Depends, Query
+from starlette.concurrency import run_in_threadpool
 
 from app.api.routes.v1.yfinance.base import create_sector_router, sector_endpoint
 from app.api.dependencies import get_sector_object
+from app.services.yfinance_service import YFinanceService
 
 # Create router for this endpoint
 router = create_sector_router()
 
+# Create service instance
+yfinance_service = YFinanceService()
+
 
 @router.get(
     "/{sector}/top-companies",
-    response_model=List[Dict[str, Any]],
+    response_model=Union[Dict[str, Any], List[Dict[str, Any]]],
     summary="Get Sector Top Companies",
     description="Returns the top companies within the specified sector, sorted by market capitalization or other criteria."
 )
 @sector_endpoint(
     path="/{sector}/top-companies",
-    cache_duration="1_week",
-    attribute_name="top_companies"
+    cache_duration="1_week"
 )
 async def get_sector_top_companies(
         sector_obj=Depends(get_sector_object),
@@ -35,11 +39,5 @@ async def get_sector_top_companies(
     Returns:
         List[Dict[str, Any]]: List of top companies in the sector
     """
-    # Get top companies from a sector object
-    companies = sector_obj.top_companies
-
-    # Limit results if needed
-    if isinstance(companies, list) and len(companies) > limit:
-        companies = companies[:limit]
-
-    return companies
\ No newline at end of file
+    # Get only the requested number of companies, off the event loop
+    return await run_in_threadpool(yfinance_service.get_sector_top, sector_obj.key, "top_companies", limit)
@@ -1,25 +1,29 @@
 """Sector top ETFs endpoint for YFinance API."""
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 
 from fastapi import Depends, Query
+from starlette.concurrency import run_in_threadpool
 
 from app.api.routes.v1.yfinance.base import create_sector_router, sector_endpoint
 from app.api.dependencies import get_sector_object
+from app.services.yfinance_service import YFinanceService
 
 # Create router for this endpoint
 router = create_sector_router()
 
+# Create service instance
+yfinance_service = YFinanceService()
+
 
 @router.get(
     "/{sector}/top-etfs",
-    response_model=List[Dict[str, Any]],
+    response_model=Union[Dict[str, Any], List[Dict[str, Any]]],
     summary="Get Top ETFs for Sector",
     description="Returns the top ETFs tracking the specified sector."
 )
 @sector_endpoint(
     path="/{sector}/top-etfs",
-    cache_duration="1_week",
-    attribute_name="top_etfs"
+    cache_duration="1_week"
 )
 async def get_sector_top_etfs(
         sector_obj=Depends(get_sector_object),
@@ -35,11 +39,5 @@ async def get_sector_top_etfs(
     Returns:
         List[Dict[str, Any]]: List of top ETFs in the sector
     """
-    # Get top ETFs from a sector object
-    etfs = sector_obj.top_etfs
-
-    # Limit results if needed
-    if isinstance(etfs, list) and len(etfs) > limit:
-        etfs = etfs[:limit]
-
-    return etfs
\ No newline at end of file
+    # Get only the requested number of ETFs, off the event loop
+    return await run_in_threadpool(yfinance_service.get_sector_top, sector_obj.key, "top_etfs", limit)
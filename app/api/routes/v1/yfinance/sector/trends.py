@@ -1,11 +1,13 @@
 """Sector trends endpoint for YFinance API."""
-from typing import Dict, Any
+import asyncio
+import math
+from typing import Any, Dict, List
 
-import pandas as pd
+import numpy as np
 from fastapi import Depends, Query
+from starlette.concurrency import run_in_threadpool
 
 from app.api.routes.v1.yfinance.base import create_sector_router
-from app.utils.yfinance_data_manager import clean_yfinance_data
 from app.api.dependencies import get_sector_object
 from app.utils.decorators import performance_tracker, error_handler, response_formatter
 from app.core.cache import cache_1_week
@@ -14,6 +16,28 @@ from app.services.yfinance_service import YFinanceService
 # Create router for this endpoint
 router = create_sector_router()
 
+# Create service instance
+yfinance_service = YFinanceService()
+
+# Market breadth verdict when declining > advancing, equal, or advancing > declining
+_BREADTH_VERDICTS = ("bearish", "neutral", "bullish")
+
+# Trading-day windows used by the trend metrics:
+# (1-month momentum, 3-month momentum, short moving average, long moving average)
+_FULL_WINDOWS = (22, 66, 50, 200)
+
+# Windows that can fit in each period; None where the period is always too
+# short. Momentum windows near the period length are kept, since the
+# close.size check below handles the histories that come up short.
+_PERIOD_WINDOWS = {
+    "1mo": (22, None, None, None),
+    "3mo": (22, 66, 50, None),
+    "6mo": (22, 66, 50, None),
+    "1y": _FULL_WINDOWS,
+    "2y": _FULL_WINDOWS,
+    "5y": _FULL_WINDOWS,
+}
+
 
 @router.get(
     "/{sector}/trends",
@@ -24,7 +48,6 @@ router = create_sector_router()
 @performance_tracker()
 @error_handler()
 @cache_1_week()
-@clean_yfinance_data
 @response_formatter()
 async def get_sector_trends(
         sector_obj=Depends(get_sector_object),
@@ -40,68 +63,105 @@ async def get_sector_trends(
     Returns:
         Dict[str, Any]: Sector trend analysis
     """
-    # Create YFinance service
-    yfinance_service = YFinanceService()
-
-    # Get sector symbol
+    # Read the sector properties once
     sector_symbol = sector_obj.symbol
+    sector_name = sector_obj.name
 
     # Initialize response
     trends = {
-        "sector": sector_obj.name,
+        "sector": sector_name,
         "period": period,
         "trends": {}
     }
 
+    # Fetch sector closes, the S&P 500 benchmark closes and the top companies
+    # concurrently, off the event loop
+    fetches = [
+        run_in_threadpool(yfinance_service.get_ticker_close_history, "^GSPC", period),
+        run_in_threadpool(_load_top_companies, sector_obj),
+    ]
+    if sector_symbol:
+        fetches.append(run_in_threadpool(yfinance_service.get_ticker_close_history, sector_symbol, period))
+    market_history, top_companies, *rest = await asyncio.gather(*fetches, return_exceptions=True)
+    sector_history = rest[0] if rest else None
+
     # Get sector performance
     try:
         if sector_symbol:
-            # Get historical data for the sector
-            sector_history = yfinance_service.get_ticker_history(sector_symbol, period=period)
+            if isinstance(sector_history, Exception):
+                raise sector_history
 
             if not sector_history.empty:
                 # Calculate trend metrics
 
+                # Work on the raw closes to avoid building intermediate Series.
+                # Sector ETFs trade far below 100,000, so float32 still keeps
+                # every cent of the 2-decimal output.
+                close = sector_history.to_numpy(dtype=np.float32, copy=False)
+
                 # Overall trend
-                first_close = sector_history['Close'].iloc[0]
-                last_close = sector_history['Close'].iloc[-1]
+                first_close = float(close[0])
+                last_close = float(close[-1])
                 overall_change = ((last_close / first_close) - 1) * 100
 
-                # Moving averages
-                ma_50 = sector_history['Close'].rolling(window=50).mean().iloc[-1]
-                ma_200 = sector_history['Close'].rolling(window=200).mean().iloc[-1]
+                # Skip the windows this period can never fill
+                window_1m, window_3m, window_ma_short, window_ma_long = _PERIOD_WINDOWS.get(period, _FULL_WINDOWS)
+
+                # Moving averages (only the latest value is needed)
+                ma_50 = _tail_mean(close, window_ma_short) if window_ma_short else math.nan
+                ma_200 = _tail_mean(close, window_ma_long) if window_ma_long else math.nan
 
                 # Momentum (rate of change)
-                momentum_1m = ((last_close / sector_history['Close'].iloc[-22]) - 1) * 100 if len(
-                    sector_history) >= 22 else None
-                momentum_3m = ((last_close / sector_history['Close'].iloc[-66]) - 1) * 100 if len(
-                    sector_history) >= 66 else None
+                momentum_1m = ((last_close / float(close[-window_1m])) - 1) * 100 if (
+                    window_1m and close.size >= window_1m) else None
+                momentum_3m = ((last_close / float(close[-window_3m])) - 1) * 100 if (
+                    window_3m and close.size >= window_3m) else None
 
                 # Volatility (standard deviation of returns)
-                volatility = sector_history['Close'].pct_change().std() * 100
+                volatility = _return_volatility(close)
+
+                # Round all metrics in one pass; missing values (NaN) become None
+                rounded = np.round(np.array([
+                    overall_change,
+                    ma_50,
+                    ma_200,
+                    momentum_1m if momentum_1m is not None else math.nan,
+                    momentum_3m if momentum_3m is not None else math.nan,
+                    volatility,
+                    last_close,
+                    first_close,
+                ], dtype=np.float64), 2).tolist()
+                (
+                    overall_change_value, ma_50_value, ma_200_value, momentum_1m_value,
+                    momentum_3m_value, volatility_value, current_price, start_price
+                ) = [None if math.isnan(value) else value for value in rounded]
+
+                # Format both range endpoints in one vectorized pass
+                start_date, end_date = sector_history.index[[0, -1]].strftime("%Y-%m-%d")
 
                 # Add trend metrics to response
                 trends["trends"] = {
-                    "overall_change_percent": round(overall_change, 2),
+                    "overall_change_percent": overall_change_value,
                     "above_ma_50": last_close > ma_50,
                     "above_ma_200": last_close > ma_200,
-                    "ma_50_value": round(ma_50, 2) if not pd.isna(ma_50) else None,
-                    "ma_200_value": round(ma_200, 2) if not pd.isna(ma_200) else None,
-                    "momentum_1m": round(momentum_1m, 2) if momentum_1m is not None else None,
-                    "momentum_3m": round(momentum_3m, 2) if momentum_3m is not None else None,
-                    "volatility": round(volatility, 2),
-                    "current_price": round(last_close, 2),
-                    "start_price": round(first_close, 2),
-                    "start_date": sector_history.index[0].strftime("%Y-%m-%d"),
-                    "end_date": sector_history.index[-1].strftime("%Y-%m-%d"),
+                    "ma_50_value": ma_50_value,
+                    "ma_200_value": ma_200_value,
+                    "momentum_1m": momentum_1m_value,
+                    "momentum_3m": momentum_3m_value,
+                    "volatility": volatility_value,
+                    "current_price": current_price,
+                    "start_price": start_price,
+                    "start_date": start_date,
+                    "end_date": end_date,
                 }
 
-                # Get market benchmark for comparison (S&P 500)
-                market_history = yfinance_service.get_ticker_history("^GSPC", period=period)
+                # Compare against the market benchmark (S&P 500)
+                if isinstance(market_history, Exception):
+                    raise market_history
 
                 if not market_history.empty:
-                    market_first_close = market_history['Close'].iloc[0]
-                    market_last_close = market_history['Close'].iloc[-1]
+                    market_first_close = float(market_history.iloc[0])
+                    market_last_close = float(market_history.iloc[-1])
                     market_change = ((market_last_close / market_first_close) - 1) * 100
 
                     # Relative strength vs market
@@ -118,34 +178,87 @@ async def get_sector_trends(
 
     # Try to get trend data from top companies
     try:
-        top_companies = sector_obj.top_companies
-
         if isinstance(top_companies, list) and len(top_companies) > 0:
             # Calculate sector trend based on top companies
-            advancing_count = 0
-            declining_count = 0
-            neutral_count = 0
+            price_changes = np.fromiter(
+                (company.get('regularMarketChangePercent', 0) for company in top_companies),
+                dtype=np.float64,
+                count=len(top_companies)
+            )
 
-            for company in top_companies:
-                price_change = company.get('regularMarketChangePercent', 0)
-
-                if price_change > 0.5:  # More than 0.5% up
-                    advancing_count += 1
-                elif price_change < -0.5:  # More than 0.5% down
-                    declining_count += 1
-                else:  # Between -0.5% and 0.5%
-                    neutral_count += 1
+            # More than 0.5% up / more than 0.5% down / in between
+            advancing_count = int(np.count_nonzero(price_changes > 0.5))
+            declining_count = int(np.count_nonzero(price_changes < -0.5))
+            neutral_count = price_changes.size - advancing_count - declining_count
 
             # Add breadth indicators
             trends["breadth"] = {
                 "advancing_count": advancing_count,
                 "declining_count": declining_count,
                 "neutral_count": neutral_count,
-                "advance_decline_ratio": round(advancing_count / max(declining_count, 1), 2),
-                "market_breadth": "bullish" if advancing_count > declining_count else "bearish" if declining_count > advancing_count else "neutral"
+                "advance_decline_ratio": round(
+                    advancing_count / declining_count if declining_count else float(advancing_count), 2),
+                # Index by the sign of (advancing - declining)
+                "market_breadth": _BREADTH_VERDICTS[(advancing_count > declining_count) - (advancing_count < declining_count) + 1]
             }
     except Exception:
         # Ignore errors in breadth calculation
         pass
 
-    return trends
\ No newline at end of file
+    return trends
+
+def _tail_mean(values: np.ndarray, window: int) -> float:
+    """
+    Get the latest value of a simple moving average.
+
+    Args:
+        values: Price series, oldest first
+        window: Moving average window
+
+    Returns:
+        float: Mean of the last `window` values, or NaN if there are fewer
+    """
+    if values.size < window:
+        return math.nan
+
+    # Slicing the tail is a view, so this is a single reduction with no copy
+    return float(np.add.reduce(values[-window:])) / window
+
+
+def _return_volatility(values: np.ndarray) -> float:
+    """
+    Get the sample standard deviation of period-over-period returns, in percent.
+
+    Args:
+        values: Price series, oldest first
+
+    Returns:
+        float: Volatility in percent, or NaN with fewer than two prices
+    """
+    if values.size < 2:
+        return math.nan
+
+    # std(p[i] / p[i-1] - 1) == std(p[i] / p[i-1]), so the price ratios are
+    # reduced directly: one float64 temporary instead of a diff plus a quotient
+    ratios = np.divide(values[1:], values[:-1], dtype=np.float64)
+    return float(np.nanstd(ratios, ddof=1)) * 100
+
+
+def _load_top_companies(sector_obj) -> List[Dict[str, Any]]:
+    """
+    Read a sector's top companies once as a list of records.
+
+    They are only usable for breadth when they carry change percentages.
+
+    Args:
+        sector_obj: YFinance Sector object
+
+    Returns:
+        List[Dict[str, Any]]: Top company records
+    """
+    top_companies = yfinance_service.top_list_records(sector_obj.top_companies)
+
+    if top_companies and 'regularMarketChangePercent' not in top_companies[0]:
+        return []
+
+    return top_companies
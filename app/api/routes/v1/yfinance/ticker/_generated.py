@@ -0,0 +1,203 @@
+"""Table-driven ticker endpoints for YFinance API.
+
+Endpoints that simply expose a yfinance Ticker attribute are generated here
+from a single table instead of living in one module each.
+"""
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+from app.api.routes.v1.yfinance.base import create_ticker_router, ticker_endpoint
+
+# Create router for these endpoints
+router = create_ticker_router()
+
+
+class TickerEndpointSpec(NamedTuple):
+    """Definition of a ticker endpoint backed by a single yfinance attribute."""
+    path: str
+    attribute_name: str
+    cache_duration: str
+    invalidate_at_midnight: bool
+    response_model: Any
+    summary: str
+    description: str
+    # Extra paths served by the same handler (and the same cached response)
+    aliases: Tuple[str, ...] = ()
+
+
+TICKER_ENDPOINT_SPECS = (
+    TickerEndpointSpec(
+        "/{ticker}/actions", "actions", "1_day", True, List[Dict[str, Any]],
+        "Get Actions",
+        "Returns corporate actions (dividends and splits) for the specified ticker. Updated daily at midnight UTC."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/analyst-price-targets", "analyst_price_targets", "1_day", True, List[Dict[str, Any]],
+        "Get Analyst Price Targets",
+        "Returns analyst price targets for the specified ticker. Updated daily at midnight UTC."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/balance-sheet", "balance_sheet", "1_day", True, List[Dict[str, Any]],
+        "Get Balance Sheet",
+        "Returns the balance sheet for the specified ticker. Updated daily at midnight UTC.",
+        aliases=("/{ticker}/balancesheet",)
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/basic-info", "basic_info", "3_months", True, Dict[str, Any],
+        "Get Basic Info",
+        "Returns basic information about the specified ticker, including name, sector, industry, and market data."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/calendar", "calendar", "1_week", True, Dict[str, Any],
+        "Get Calendar Events",
+        "Returns upcoming calendar events like earnings and ex-dividend dates for the specified ticker."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/cash-flow", "cash_flow", "1_day", True, List[Dict[str, Any]],
+        "Get Cash Flow",
+        "Returns the cash flow statement for the specified ticker. Updated daily at midnight UTC.",
+        aliases=("/{ticker}/cashflow",)
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/dividends", "dividends", "1_day", True, Dict[str, Any],
+        "Get Dividends",
+        "Returns historical dividends for the specified ticker. Updated daily at midnight UTC."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/earnings", "earnings", "1_day", True, Dict[str, Any],
+        "Get Earnings",
+        "Returns historical earnings data for the specified ticker. Updated daily at midnight UTC."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/earnings-dates", "earnings_dates", "1_week", True, List[Dict[str, Any]],
+        "Get Earnings Dates",
+        "Returns upcoming and past earnings dates for the specified ticker."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/fast-info", "fast_info", "3_months", True, Dict[str, Any],
+        "Get Fast Info",
+        "Returns quickly accessible basic information for the specified ticker."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/financials", "financials", "1_day", True, Dict[str, Any],
+        "Get Financials",
+        "Returns financial statements for the specified ticker. Updated daily at midnight UTC."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/income-stmt", "income_stmt", "1_day", True, List[Dict[str, Any]],
+        "Get Income Statement",
+        "Returns the income statement for the specified ticker. Updated daily at midnight UTC.",
+        aliases=("/{ticker}/incomestmt",)
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/info", "info", "3_months", True, Dict[str, Any],
+        "Get Full Info",
+        "Returns comprehensive information about the specified ticker."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/insider-transactions", "insider_transactions", "1_day", True, List[Dict[str, Any]],
+        "Get Insider Transactions",
+        "Returns insider transactions for the specified ticker. Updated daily at midnight UTC."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/institutional-holders", "institutional_holders", "1_week", True, List[Dict[str, Any]],
+        "Get Institutional Holders",
+        "Returns institutional holders for the specified ticker."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/isin", "isin", "3_months", True, str,
+        "Get ISIN",
+        "Returns the International Securities Identification Number (ISIN) for the specified ticker."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/major-holders", "major_holders", "1_week", True, List[Dict[str, Any]],
+        "Get Major Holders",
+        "Returns major holders for the specified ticker."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/news", "news", "1_day", True, List[Dict[str, Any]],
+        "Get News",
+        "Returns recent news articles for the specified ticker. Updated daily at midnight UTC."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/options", "options", "1_day", True, List[str],
+        "Get Options Expiration Dates",
+        "Returns available options expiration dates for the specified ticker. Updated daily at midnight UTC."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/quarterly-balance-sheet", "quarterly_balance_sheet", "1_day", True, Dict[str, Any],
+        "Get Quarterly Balance Sheet",
+        "Returns the quarterly balance sheet for the specified ticker. Updated daily at midnight UTC."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/quarterly-cash-flow", "quarterly_cash_flow", "1_day", True, Dict[str, Any],
+        "Get Quarterly Cash Flow",
+        "Returns the quarterly cash flow statement for the specified ticker. Updated daily at midnight UTC."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/quarterly-income-stmt", "quarterly_income_stmt", "1_day", True, Dict[str, Any],
+        "Get Quarterly Income Statement",
+        "Returns the quarterly income statement for the specified ticker. Updated daily at midnight UTC."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/recommendations", "recommendations", "1_day", True, Dict[str, Any],
+        "Get Recommendations",
+        "Returns analyst recommendations for the specified ticker. Updated daily at midnight UTC."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/splits", "splits", "1_week", True, Dict[str, Any],
+        "Get Stock Splits",
+        "Returns historical stock splits for the specified ticker."
+    ),
+    TickerEndpointSpec(
+        "/{ticker}/sustainability", "sustainability", "1_month", True, Dict[str, Any],
+        "Get Sustainability",
+        "Returns sustainability (ESG) scores and data for the specified ticker."
+    ),
+)
+
+
+def _make_endpoint_stub(spec: TickerEndpointSpec) -> Callable:
+    """
+    Create the named placeholder that ticker_endpoint replaces with its implementation.
+
+    Args:
+        spec: Endpoint definition
+
+    Returns:
+        Callable: Placeholder coroutine function named after the attribute
+    """
+    async def endpoint():
+        # No implementation needed - the ticker_endpoint decorator handles it
+        # when attribute_name is provided
+        pass
+
+    endpoint.__name__ = endpoint.__qualname__ = f"get_ticker_{spec.attribute_name}"
+    endpoint.__doc__ = spec.summary
+    return endpoint
+
+
+def register_ticker_endpoints(specs=TICKER_ENDPOINT_SPECS) -> None:
+    """
+    Register a generated endpoint on the router for each spec and its aliases.
+
+    Args:
+        specs: Endpoint definitions to register
+    """
+    for spec in specs:
+        endpoint = ticker_endpoint(
+            path=spec.path,
+            cache_duration=spec.cache_duration,
+            invalidate_at_midnight=spec.invalidate_at_midnight,
+            attribute_name=spec.attribute_name
+        )(_make_endpoint_stub(spec))
+
+        for path in (spec.path, *spec.aliases):
+            router.get(
+                path,
+                response_model=spec.response_model,
+                summary=spec.summary,
+                description=spec.description
+            )(endpoint)
+
+
+register_ticker_endpoints()
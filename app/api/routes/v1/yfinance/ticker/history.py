@@ -1,23 +1,41 @@
 """History endpoint for YFinance API."""
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional
 
+import numpy as np
+import orjson
+import pandas as pd
 from fastapi import Path, Query
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from app.api.routes.v1.yfinance.base import create_ticker_router
 from app.utils.yfinance_data_manager import clean_yfinance_data
-from app.utils.decorators import performance_tracker, error_handler, response_formatter
+from app.utils.decorators import performance_tracker, error_handler, response_formatter, orjson_response
 from app.core.cache import cache_1_day
+from app.models.enums import HistoryLayout
 from app.services.yfinance_service import YFinanceService
 
 # Create router for this endpoint
 router = create_ticker_router()
 
+# Create service instance
+yfinance_service = YFinanceService()
+
+# (yfinance column, response key) pairs for the per-row price fields
+_PRICE_COLUMNS = (("Open", "open"), ("High", "high"), ("Low", "low"), ("Close", "close"))
+
+# Number of rows converted per NDJSON chunk when streaming
+_STREAM_CHUNK_ROWS = 500
+
 
 @router.get(
     "/{ticker}/history",
     response_model=Dict[str, Any],
     summary="Get Historical Data",
-    description="Returns historical price and volume data for the specified ticker."
+    description="Returns historical price and volume data for the specified ticker. "
+                "With layout=columns, data is {\"n\": <rows>, \"columns\": {<field>: [...]}}, "
+                "one array of n values per field; row i is the i-th value of every array."
 )
+@orjson_response()
 @performance_tracker()
 @error_handler()
 @cache_1_day()
@@ -31,7 +49,11 @@ async def get_ticker_history(
         end: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
         prepost: bool = Query(False, description="Include pre and post market data"),
         actions: bool = Query(True, description="Include dividends and stock splits"),
-        auto_adjust: bool = Query(True, description="Adjust all OHLC automatically")
+        auto_adjust: bool = Query(True, description="Adjust all OHLC automatically"),
+        layout: HistoryLayout = Query(
+            HistoryLayout.RECORDS,
+            description="Data layout: records (one object per data point) or columns (one array per field)"
+        )
 ):
     """
     Get historical data for a ticker.
@@ -45,13 +67,99 @@ async def get_ticker_history(
         prepost: Include pre- and post-market data
         actions: Include dividends and stock splits
         auto_adjust: Adjust all OHLC automatically
+        layout: Data layout (records or columns)
 
     Returns:
         Dict[str, Any]: Historical price and volume data
     """
-    # Create YFinance service
-    yfinance_service = YFinanceService()
+    history_params = _history_params(period, interval, start, end, prepost, actions, auto_adjust)
+
+    # Get historical data, off the event loop
+    history = await run_in_threadpool(yfinance_service.get_ticker_history, ticker, **history_params)
+
+    # Convert to dictionary and process
+    result = {
+        "ticker": ticker,
+        "parameters": _response_parameters(period, interval, start, end, prepost, actions, auto_adjust),
+        "data": {"n": 0, "columns": {}} if layout == HistoryLayout.COLUMNS else []
+    }
+
+    # The service returns an empty list when there is no data
+    if len(history) > 0:
+        if layout == HistoryLayout.COLUMNS:
+            result["data"] = {"n": len(history), "columns": _history_to_column_lists(history)}
+        else:
+            result["data"] = _history_to_records(history)
 
+    return result
+
+
+@router.get(
+    "/{ticker}/history/stream",
+    summary="Stream Historical Data",
+    description="Streams historical price and volume data for the specified ticker as NDJSON. "
+                "The first line holds the ticker and parameters, followed by one data point per line.",
+    response_class=StreamingResponse
+)
+@performance_tracker()
+@error_handler()
+async def stream_ticker_history(
+        ticker: str = Path(..., description="Stock ticker symbol", example="AAPL"),
+        period: Optional[str] = Query(None, description="Time period to download (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)"),
+        interval: str = Query("1d", description="Data interval (1m, 2m, 5m, 15m, 30m, 60m, 90m, 1h, 1d, 5d, 1wk, 1mo, 3mo)"),
+        start: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
+        end: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+        prepost: bool = Query(False, description="Include pre and post market data"),
+        actions: bool = Query(True, description="Include dividends and stock splits"),
+        auto_adjust: bool = Query(True, description="Adjust all OHLC automatically")
+):
+    """
+    Stream historical data for a ticker as newline-delimited JSON.
+
+    Data points match those of /history, but are encoded and sent in chunks
+    so the full payload is never held in memory.
+
+    Args:
+        ticker: Stock ticker symbol
+        period: Time period to download
+        interval: Data interval
+        start: Start date
+        end: End date
+        prepost: Include pre- and post-market data
+        actions: Include dividends and stock splits
+        auto_adjust: Adjust all OHLC automatically
+
+    Returns:
+        StreamingResponse: NDJSON stream of the header and data points
+    """
+    history_params = _history_params(period, interval, start, end, prepost, actions, auto_adjust)
+
+    # Fetch before streaming starts, so errors still produce a proper response
+    history = await run_in_threadpool(yfinance_service.get_ticker_history, ticker, **history_params)
+
+    header = {
+        "ticker": ticker,
+        "parameters": _response_parameters(period, interval, start, end, prepost, actions, auto_adjust)
+    }
+
+    return StreamingResponse(_ndjson_lines(header, history), media_type="application/x-ndjson")
+
+
+def _history_params(
+        period: Optional[str],
+        interval: str,
+        start: Optional[str],
+        end: Optional[str],
+        prepost: bool,
+        actions: bool,
+        auto_adjust: bool
+) -> Dict[str, Any]:
+    """
+    Build the yfinance history arguments for a request.
+
+    Returns:
+        Dict[str, Any]: Keyword arguments for get_ticker_history
+    """
     # Set up history parameters
     history_params = {
         "interval": interval,
@@ -70,44 +178,132 @@ async def get_ticker_history(
         # If neither start nor end is provided, use period
         history_params["period"] = period or "1mo"
 
-    # Get historical data
-    history = yfinance_service.get_ticker_history(ticker, **history_params)
+    return history_params
 
-    # Convert to dictionary and process
-    result = {
-        "ticker": ticker,
-        "parameters": {
-            "period": period,
-            "interval": interval,
-            "start": start,
-            "end": end,
-            "prepost": prepost,
-            "actions": actions,
-            "auto_adjust": auto_adjust
-        },
-        "data": []
+
+def _response_parameters(
+        period: Optional[str],
+        interval: str,
+        start: Optional[str],
+        end: Optional[str],
+        prepost: bool,
+        actions: bool,
+        auto_adjust: bool
+) -> Dict[str, Any]:
+    """
+    Build the parameters block echoed back in history responses.
+
+    Returns:
+        Dict[str, Any]: Request parameters
+    """
+    return {
+        "period": period,
+        "interval": interval,
+        "start": start,
+        "end": end,
+        "prepost": prepost,
+        "actions": actions,
+        "auto_adjust": auto_adjust
     }
 
-    if not history.empty:
-        # Convert to a list of records
-        for date, row in history.iterrows():
-            # Fixed: Don't call the date object, use strftime instead
-            data_point = {
-                "date": date.strftime("%Y-%m-%d"),
-                "open": float(row["Open"]) if "Open" in row else None,
-                "high": float(row["High"]) if "High" in row else None,
-                "low": float(row["Low"]) if "Low" in row else None,
-                "close": float(row["Close"]) if "Close" in row else None,
-                "volume": int(row["Volume"]) if "Volume" in row else None
-            }
-
-            # Add dividends and splits if available
-            if "Dividends" in row and row["Dividends"] > 0:
-                data_point["dividends"] = float(row["Dividends"])
-
-            if "Stock Splits" in row and row["Stock Splits"] != 0:
-                data_point["stock_splits"] = float(row["Stock Splits"])
-
-            result["data"].append(data_point)
-
-    return result
\ No newline at end of file
+
+def _ndjson_lines(header: Dict[str, Any], history: Any) -> Iterator[bytes]:
+    """
+    Encode a history frame as NDJSON, one chunk of rows at a time.
+
+    Args:
+        header: First line of the stream
+        history: Historical data indexed by date, or an empty list
+
+    Yields:
+        bytes: Encoded lines
+    """
+    yield orjson.dumps(header) + b"\n"
+
+    for offset in range(0, len(history), _STREAM_CHUNK_ROWS):
+        records = _history_to_records(history.iloc[offset:offset + _STREAM_CHUNK_ROWS])
+        yield b"".join(orjson.dumps(record) + b"\n" for record in records)
+
+
+def _history_columns(history: pd.DataFrame) -> Dict[str, List[Any]]:
+    """
+    Convert the date and OHLCV columns of a yfinance history frame to lists.
+
+    Each column is converted to Python scalars with tolist(), in a single
+    C pass. OHLC and volume are always present, as None if missing.
+
+    Args:
+        history: Historical data indexed by date
+
+    Returns:
+        Dict[str, List[Any]]: Column lists keyed by response field name
+    """
+    row_count = len(history)
+    columns = {"date": history.index.strftime("%Y-%m-%d").tolist()}
+
+    for column, key in _PRICE_COLUMNS:
+        columns[key] = (
+            history[column].to_numpy(dtype=float).tolist() if column in history.columns
+            else [None] * row_count
+        )
+    columns["volume"] = (
+        history["Volume"].fillna(0).to_numpy(dtype="int64").tolist() if "Volume" in history.columns
+        else [None] * row_count
+    )
+
+    return columns
+
+
+def _history_to_records(history: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Convert a yfinance history frame to a list of data points.
+
+    The frame is converted column-wise to Python lists, which are then
+    zipped into one dict per row.
+
+    Args:
+        history: Historical data indexed by date
+
+    Returns:
+        List[Dict[str, Any]]: One data point per row
+    """
+    columns = _history_columns(history)
+    keys = list(columns)
+    records = [dict(zip(keys, values)) for values in zip(*columns.values())]
+
+    # Dividends and splits are rare, so only visit the rows that have them
+    if "Dividends" in history.columns:
+        dividends = history["Dividends"].to_numpy(dtype=float)
+        for i in np.flatnonzero(dividends > 0):
+            records[i]["dividends"] = float(dividends[i])
+
+    if "Stock Splits" in history.columns:
+        splits = history["Stock Splits"].to_numpy(dtype=float)
+        for i in np.flatnonzero(splits != 0):
+            records[i]["stock_splits"] = float(splits[i])
+
+    return records
+
+
+def _history_to_column_lists(history: pd.DataFrame) -> Dict[str, List[Any]]:
+    """
+    Convert a yfinance history frame to aligned per-field arrays.
+
+    Unlike the records layout, dividends and stock splits are full columns
+    (0 on rows without an action) whenever the frame includes them.
+
+    Args:
+        history: Historical data indexed by date
+
+    Returns:
+        Dict[str, List[Any]]: One array per field, aligned by position
+    """
+    columns = _history_columns(history)
+
+    if "Dividends" in history.columns:
+        columns["dividends"] = history["Dividends"].to_numpy(dtype=float).tolist()
+
+    if "Stock Splits" in history.columns:
+        columns["stock_splits"] = history["Stock Splits"].to_numpy(dtype=float).tolist()
+
+    return columns
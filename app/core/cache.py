@@ -3,12 +3,11 @@
 This module provides decorators and utilities for caching API responses.
 """
 import logging
-from datetime import datetime, timedelta, time, timezone
 from typing import Callable, Optional
 
 import redis
 from app.core.config import settings
-from app.services.cache_service import CacheService
+from app.services.cache_service import CacheService, seconds_until_midnight
 
 logger = logging.getLogger(__name__)
 
@@ -29,13 +28,17 @@ def setup_cache() -> None:
             port=settings.REDIS_PORT,
             db=settings.REDIS_DB,
             password=settings.REDIS_PASSWORD,
-            decode_responses=False,  # We want binary data for pickle
+            decode_responses=False,  # Cached payloads are binary
             socket_timeout=5,
             socket_connect_timeout=5
         )
         # Test connection
         _redis_client.ping()
         logger.info("Successfully connected to Redis for caching")
+
+        # Create the cache service's clients, including its async pool, now
+        # rather than on the first cached request
+        CacheService()
     except redis.ConnectionError as e:
         logger.warning(f"Could not connect to Redis: {str(e)}. Caching will be disabled.")
         _redis_client = None
@@ -138,9 +141,7 @@ def calculate_seconds_until_midnight() -> int:
     Returns:
         int: Seconds until midnight UTC
     """
-    now = datetime.now(timezone.utc)
-    midnight = datetime.combine(now.date() + timedelta(days=1), time(0, 0))
-    return int((midnight - now).total_seconds())
+    return seconds_until_midnight()
 
 
 def clear_cache_namespace(namespace: str) -> int:
@@ -169,10 +170,11 @@ def get_cache_stats() -> dict:
     client = get_redis_client()
     try:
         info = client.info()
-        keys = client.keys(f"{settings.CACHE_PREFIX}:*")
+        # Count incrementally with SCAN; KEYS would block Redis for the whole walk
+        key_count = sum(1 for _ in client.scan_iter(match=f"{settings.CACHE_PREFIX}:*", count=500))
         return {
             "available": True,
-            "key_count": len(keys),
+            "key_count": key_count,
             "memory_used": info.get("used_memory_human", "unknown"),
             "hit_rate": info.get("keyspace_hits", 0) / (
                         info.get("keyspace_hits", 0) + info.get("keyspace_misses", 1) or 1),
@@ -33,7 +33,15 @@ class Settings(BaseSettings):
     REDIS_PORT: int = Field(6379, env="REDIS_PORT")
     REDIS_DB: int = Field(0, env="REDIS_DB")
     REDIS_PASSWORD: Optional[str] = Field(None, env="REDIS_PASSWORD")
+    REDIS_MAX_CONNECTIONS: int = Field(64, env="REDIS_MAX_CONNECTIONS")
     CACHE_PREFIX: str = Field("yfinance_api", env="CACHE_PREFIX")
+    CACHE_LOCAL_TTL: int = Field(60, env="CACHE_LOCAL_TTL")
+    CACHE_LOCAL_MAXSIZE: int = Field(256, env="CACHE_LOCAL_MAXSIZE")
+    CACHE_STALE_TTL: int = Field(7 * 24 * 60 * 60, env="CACHE_STALE_TTL")
+    CACHE_STALE_RETRY_TTL: int = Field(5 * 60, env="CACHE_STALE_RETRY_TTL")
+    CACHE_BATCH_WINDOW_MS: float = Field(2, env="CACHE_BATCH_WINDOW_MS")
+    CACHE_BATCH_MAX_SIZE: int = Field(64, env="CACHE_BATCH_MAX_SIZE")
+    CACHE_MIDNIGHT_JITTER: int = Field(60 * 60, env="CACHE_MIDNIGHT_JITTER")
 
     # Security settings
     API_KEY: Optional[str] = Field(None, env="API_KEY")
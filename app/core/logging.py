@@ -2,20 +2,26 @@
 
 This module sets up logging for the application using Python's logging module.
 """
+import atexit
 import logging
 import logging.config
+import logging.handlers
 import json
+import queue
 import sys
 import os
 from datetime import datetime, timezone
 from logging import Logger, LoggerAdapter
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Union
 
 from app.core.config import settings
 
 # Define custom log levels
 TRACE_LEVEL = 5  # More detailed than DEBUG
 
+# Background listener that performs the actual log I/O
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 class JsonFormatter(logging.Formatter):
     """
@@ -62,6 +68,79 @@ class JsonFormatter(logging.Formatter):
         return json.dumps(log_data)
 
 
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler for an in-process listener.
+
+    Unlike the stock QueueHandler, records keep their exception info so the
+    listener's formatters (e.g. JsonFormatter) can render it themselves.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepare a record for queuing.
+
+        Args:
+            record: Log record to prepare
+
+        Returns:
+            logging.LogRecord: Record with its message already rendered
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _enable_queue_logging(logger_names: list) -> None:
+    """
+    Move log output for the given loggers onto a background thread.
+
+    The configured handlers are detached from the loggers and attached to a
+    QueueListener; the loggers get a single non-blocking queue handler, so
+    request handlers never block on stdout or file writes.
+
+    Args:
+        logger_names: Names of the configured loggers
+    """
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+    # Collect the handlers created by dictConfig
+    loggers = [logging.getLogger(name or None) for name in logger_names]
+    handlers = []
+    for logger in loggers:
+        for handler in logger.handlers:
+            if handler not in handlers:
+                handlers.append(handler)
+
+    queue_handler = LocalQueueHandler(queue.SimpleQueue())
+    for logger in loggers:
+        logger.handlers = [queue_handler]
+
+    _queue_listener = logging.handlers.QueueListener(
+        queue_handler.queue,
+        *handlers,
+        respect_handler_level=True
+    )
+    _queue_listener.start()
+
+
+def stop_logging() -> None:
+    """
+    Flush queued log records and stop the background listener.
+    """
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(stop_logging)
+
+
 def setup_logging() -> None:
     """
     Configure application logging.
@@ -143,6 +222,9 @@ def setup_logging() -> None:
     # Apply configuration
     logging.config.dictConfig(log_config)
 
+    # Perform log I/O off the request path
+    _enable_queue_logging(list(log_config["loggers"]))
+
     # Log startup message
     logger = logging.getLogger("app")
     logger.info(
@@ -10,11 +10,12 @@ This module contains middleware for request processing, including
 import logging
 import time
 import uuid
-from typing import Callable, Any, Optional
+from typing import Callable
 
 from fastapi import FastAPI, Request, Response
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
 from app.core.exceptions import RateLimitExceededError
@@ -24,36 +25,69 @@ from app.services.cache_service import CacheService
 logger = logging.getLogger(__name__)
 
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
+def _request_id(scope: Scope) -> str:
+    """
+    Get the request ID for a request, generating it on first use.
+
+    The ID is kept in the request state, so every middleware and the
+    endpoint (via request.state.request_id) see the same value.
+
+    Args:
+        scope: The ASGI connection scope
+
+    Returns:
+        str: The request ID
+    """
+    state = scope.setdefault("state", {})
+    request_id = state.get("request_id")
+    if request_id is None:
+        request_id = state["request_id"] = str(uuid.uuid4())
+    return request_id
+
+
+class RequestIdMiddleware:
     """
     Middleware that adds a unique request ID to each request.
 
-    This ID can be used to track requests through the system.
+    This ID can be used to track requests through the system. It is a plain
+    ASGI middleware, so the request and response are never wrapped in
+    Request/Response objects.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
         """
-        Process request to add a unique request ID.
+        Initialize request ID middleware.
 
         Args:
-            request: The HTTP request
-            call_next: The next middleware or endpoint
+            app: The ASGI application
+        """
+        self.app = app
 
-        Returns:
-            Response: The HTTP response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        # Generate a unique request ID
-        request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
+        Process request to add a unique request ID.
 
-        # Add the request ID to response headers
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
+        Args:
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        return response
+        request_id = _request_id(scope)
+
+        async def send_with_request_id(message: Message) -> None:
+            # Add the request ID to response headers
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """
     Middleware for logging requests and responses.
 
@@ -61,74 +95,77 @@ class LoggingMiddleware(BaseHTTPMiddleware):
     including timing information.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
         """
-        Process request to log information.
+        Initialize logging middleware.
 
         Args:
-            request: The HTTP request
-            call_next: The next middleware or endpoint
+            app: The ASGI application
+        """
+        self.app = app
 
-        Returns:
-            Response: The HTTP response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
+        Process request to log information.
+
+        Args:
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Get request information
         start_time = time.time()
-        request_id = getattr(request.state, "request_id", str(uuid.uuid4()))
+        request_id = _request_id(scope)
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        headers = Headers(scope=scope)
 
         # Log request
         logger.info(
-            f"Request started: {request.method} {request.url.path}",
+            f"Request started: {method} {path}",
             extra={
                 "data": {
                     "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "query": str(request.query_params),
-                    "client_host": request.client.host if request.client else "unknown",
-                    "user_agent": request.headers.get("user-agent", "unknown"),
+                    "method": method,
+                    "path": path,
+                    "query": scope.get("query_string", b"").decode("latin-1"),
+                    "client_host": client[0] if client else "unknown",
+                    "user_agent": headers.get("user-agent", "unknown"),
                 }
             }
         )
 
-        # Process request
-        try:
-            response = await call_next(request)
-
-            # Calculate response time
-            process_time = time.time() - start_time
-
-            # Log response
-            logger.info(
-                f"Request completed: {request.method} {request.url.path} {response.status_code}",
-                extra={
-                    "data": {
-                        "request_id": request_id,
-                        "method": request.method,
-                        "path": request.url.path,
-                        "status_code": response.status_code,
-                        "processing_time": process_time,
-                    }
-                }
-            )
+        status_code = None
 
-            # Add timing header
-            response.headers["X-Process-Time"] = str(process_time)
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
 
-            return response
+                # Add timing header
+                MutableHeaders(scope=message)["X-Process-Time"] = str(time.time() - start_time)
+            await send(message)
 
+        # Process request
+        try:
+            await self.app(scope, receive, send_with_timing)
         except Exception as e:
             # Calculate response time
             process_time = time.time() - start_time
 
             # Log exception
             logger.exception(
-                f"Request failed: {request.method} {request.url.path}",
+                f"Request failed: {method} {path}",
                 extra={
                     "data": {
                         "request_id": request_id,
-                        "method": request.method,
-                        "path": request.url.path,
+                        "method": method,
+                        "path": path,
                         "error": str(e),
                         "processing_time": process_time,
                     }
@@ -138,6 +175,23 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             # Re-raise the exception
             raise
 
+        # Calculate response time
+        process_time = time.time() - start_time
+
+        # Log response
+        logger.info(
+            f"Request completed: {method} {path} {status_code}",
+            extra={
+                "data": {
+                    "request_id": request_id,
+                    "method": method,
+                    "path": path,
+                    "status_code": status_code,
+                    "processing_time": process_time,
+                }
+            }
+        )
+
 
 def _should_skip_rate_limit(request: Request) -> bool:
     """
@@ -332,61 +386,49 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         return ttl
 
 
-def _parse_endpoint_name(request: Request) -> str:
-    """
-    Parse the endpoint name from the request.
-
-    Args:
-        request: The HTTP request
-
-    Returns:
-        str: The endpoint name
-    """
-    # Get a route path if available
-    if hasattr(request, "scope") and "route" in request.scope and hasattr(request.scope["route"], "path"):
-        return request.scope["route"].path
-
-    # Otherwise use URL path
-    return request.url.path
-
-
-class PerformanceMiddleware(BaseHTTPMiddleware):
+class PerformanceMiddleware:
     """
     Middleware for tracking request performance.
 
     This middleware records performance metrics for each request.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Optional[Any]:
+    def __init__(self, app: ASGIApp):
         """
-        Process request to track performance.
+        Initialize performance middleware.
 
         Args:
-            request: The HTTP request
-            call_next: The next middleware or endpoint
+            app: The ASGI application
+        """
+        self.app = app
+        self.metrics_service = MetricsService()
 
-        Returns:
-            Response: The HTTP response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        if not settings.METRICS_ENABLED:
-            return await call_next(request)
+        Process request to track performance.
 
-        # Get metrics service
-        metrics_service = MetricsService()
+        Args:
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
+        """
+        if scope["type"] != "http" or not settings.METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
 
         # Start timer
         start_time = time.time()
 
-        # Parse endpoint name
-        endpoint_name = _parse_endpoint_name(request)
+        # The route is not resolved yet, so the endpoint is named by its path
+        endpoint_name = scope["path"]
 
         # Set endpoint as active
-        metrics_service.set_endpoint_active(endpoint_name)
+        self.metrics_service.set_endpoint_active(endpoint_name)
 
         # Process request
         error = False
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send)
         except Exception:
             error = True
             raise
@@ -395,17 +437,15 @@ class PerformanceMiddleware(BaseHTTPMiddleware):
             response_time = time.time() - start_time
 
             # Record metrics
-            metrics_service.record_endpoint_call(
+            self.metrics_service.record_endpoint_call(
                 endpoint_name=endpoint_name,
-                path=request.url.path,
+                path=endpoint_name,
                 response_time=response_time,
                 error=error
             )
 
             # Set endpoint as inactive
-            metrics_service.set_endpoint_inactive(endpoint_name)
-
-        return response
+            self.metrics_service.set_endpoint_inactive(endpoint_name)
 
 
 def add_middleware(app: FastAPI) -> None:
@@ -39,7 +39,7 @@ if settings.METRICS_ENDPOINT_TOKEN:
     }
 
 
-def verify_api_key(
+async def verify_api_key(
         apikey_header: Optional[str] = Security(api_key_header),
         apikey_query: Optional[str] = Security(api_key_query),
 ) -> Optional[Dict]:
@@ -94,7 +94,7 @@ def require_api_key(scopes: List[str] = None) -> Callable:
     """
     scopes = scopes or []
 
-    def _require_api_key(
+    async def _require_api_key(
             api_key: Optional[Dict] = Depends(verify_api_key),
     ) -> Dict:
         # Check if an API key is present
@@ -19,6 +19,7 @@ from app.core.cache import setup_cache
 from app.api import api_router
 from app.services.metrics_service import MetricsService
 from app.services.scheduler_service import SchedulerService
+from app.utils.formatters import ORJSONResponse
 
 # Setup logging
 setup_logging()
@@ -69,6 +70,7 @@ def create_application() -> FastAPI:
         docs_url=settings.DOCS_URL,
         redoc_url=settings.REDOC_URL,
         openapi_url=settings.OPENAPI_URL,
+        default_response_class=ORJSONResponse,
         lifespan=lifespan
     )
 
@@ -130,4 +132,23 @@ def create_application() -> FastAPI:
 app = create_application()
 
 # Log application startup
-logger.info(f"Application created: {settings.API_TITLE} v{settings.API_VERSION}")
\ No newline at end of file
+logger.info(f"Application created: {settings.API_TITLE} v{settings.API_VERSION}")
+
+
+def run() -> None:
+    """Run the application with uvicorn."""
+    import uvicorn
+
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=settings.API_PORT,
+        workers=settings.WORKERS,
+        reload=settings.RELOAD,
+        # Use uvloop when it is installed (uvicorn[standard]), asyncio otherwise
+        loop="auto"
+    )
+
+
+if __name__ == "__main__":
+    run()
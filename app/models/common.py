@@ -11,7 +11,6 @@ from typing import Generic
 
 from app.models.enums import (
     DataInterval,
-    DataPeriod,
     ResponseFormat,
     SortOrder
 )
@@ -82,7 +81,10 @@ class HistoryParams(DateRange):
     )
 
     model_config = {
-        "arbitrary_types_allowed": True
+        "arbitrary_types_allowed": True,
+        "frozen": True,
+        "extra": "forbid",
+        "validate_default": False
     }
 
 
@@ -148,7 +150,10 @@ class QueryParams(PaginationParams, SortParams, FilterParams):
 
     model_config = {
         "populate_by_name": True,
-        "arbitrary_types_allowed": True
+        "arbitrary_types_allowed": True,
+        "frozen": True,
+        "extra": "forbid",
+        "validate_default": False
     }
 
 
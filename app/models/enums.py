@@ -66,6 +66,13 @@ class SortOrder(str, Enum):
     DESC = "desc"
 
 
+class HistoryLayout(str, Enum):
+    """Enum for historical data layout options."""
+
+    RECORDS = "records"
+    COLUMNS = "columns"
+
+
 class FinancialStatement(str, Enum):
     """Enum for financial statement types."""
 
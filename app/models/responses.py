@@ -4,7 +4,7 @@ This module contains response model definitions that wrap
 data models for API responses.
 """
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
+from typing import Any, Dict, Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -3,20 +3,16 @@
 This module contains model definitions for ticker data structures
 used in the ticker endpoints of the API.
 """
-from datetime import date, datetime
+import datetime as dt
 from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
-from app.models.enums import (
-    ActionType
-)
-
 
 class TickerAction(BaseModel):
     """Model for ticker actions (dividends and splits)."""
 
-    date: datetime = Field(..., description="Date of the action")
+    date: dt.datetime = Field(..., description="Date of the action")
     action_type: str = Field(..., description="Type of action")  # Removed the alias="type"
     value: float = Field(..., description="Value of the action")
 
@@ -29,7 +25,7 @@ class TickerAction(BaseModel):
 class HistoricalData(BaseModel):
     """Model for historical price data."""
 
-    date: datetime = Field(..., description="Date of the data point")
+    date: dt.datetime = Field(..., description="Date of the data point")
     open: float = Field(..., description="Opening price")
     high: float = Field(..., description="Highest price")
     low: float = Field(..., description="Lowest price")
@@ -51,7 +47,7 @@ class TickerPrice(BaseModel):
     change: float = Field(..., description="Price change")
     percent_change: float = Field(..., description="Percentage price change")
     currency: Optional[str] = Field(None, description="Currency")
-    last_updated: Optional[datetime] = Field(None, description="Last updated timestamp")
+    last_updated: Optional[dt.datetime] = Field(None, description="Last updated timestamp")
 
     model_config = {
         "arbitrary_types_allowed": True
@@ -122,10 +118,10 @@ class TickerInfo(TickerBasicInfo):
     day_high: Optional[float] = Field(None, description="Day high")
     day_low: Optional[float] = Field(None, description="Day low")
     last_dividend_value: Optional[float] = Field(None, description="Last dividend value")
-    last_dividend_date: Optional[date] = Field(None, description="Last dividend date")
-    ex_dividend_date: Optional[date] = Field(None, description="Ex-dividend date")
+    last_dividend_date: Optional[dt.date] = Field(None, description="Last dividend date")
+    ex_dividend_date: Optional[dt.date] = Field(None, description="Ex-dividend date")
     last_split_factor: Optional[str] = Field(None, description="Last split factor")
-    last_split_date: Optional[date] = Field(None, description="Last split date")
+    last_split_date: Optional[dt.date] = Field(None, description="Last split date")
 
     model_config = {
         "populate_by_name": True,
@@ -136,7 +132,7 @@ class TickerInfo(TickerBasicInfo):
 class AnalystPriceTarget(BaseModel):
     """Model for analyst price targets."""
 
-    date: datetime = Field(..., description="Date of the price target")
+    date: dt.datetime = Field(..., description="Date of the price target")
     firm: Optional[str] = Field(None, description="Name of the firm")
     to_grade: Optional[str] = Field(None, description="New grade")
     previous_grade: Optional[str] = Field(None, description="Previous grade", alias="from_grade")
@@ -163,7 +159,7 @@ class FinancialMetric(BaseModel):
 class FinancialStatement(BaseModel):
     """Model for financial statements."""
 
-    date: date = Field(..., description="Date of the statement")
+    date: dt.date = Field(..., description="Date of the statement")
     items: Dict[str, Optional[float]] = Field(..., description="Financial statement items")
 
     model_config = {
@@ -174,7 +170,7 @@ class FinancialStatement(BaseModel):
 class EarningsData(BaseModel):
     """Model for earnings data."""
 
-    date: Optional[date] = Field(None, description="Earnings date")
+    date: Optional[dt.date] = Field(None, description="Earnings date")
     estimated_eps: Optional[float] = Field(None, description="Estimated EPS")
     reported_eps: Optional[float] = Field(None, description="Reported EPS")
     surprise: Optional[float] = Field(None, description="Earnings surprise")
@@ -222,7 +218,7 @@ class RevenueEstimate(BaseModel):
 class Recommendation(BaseModel):
     """Model for analyst recommendations."""
 
-    date: date = Field(..., description="Date of the recommendation")
+    date: dt.date = Field(..., description="Date of the recommendation")
     firm: Optional[str] = Field(None, description="Name of the firm")
     to_grade: str = Field(..., description="Recommendation grade")
     previous_grade: Optional[str] = Field(None, description="Previous grade", alias="from_grade")
@@ -239,7 +235,7 @@ class Holder(BaseModel):
 
     name: str = Field(..., description="Name of the holder")
     shares: int = Field(..., description="Number of shares held")
-    date_reported: Optional[date] = Field(None, description="Date reported")
+    date_reported: Optional[dt.date] = Field(None, description="Date reported")
     percent: Optional[float] = Field(None, description="Percentage of outstanding shares")
     value: Optional[int] = Field(None, description="Value of holding")
 
@@ -256,8 +252,8 @@ class InsiderTransaction(BaseModel):
     transaction: str = Field(..., description="Transaction type")
     shares: int = Field(..., description="Number of shares")
     value: Optional[int] = Field(None, description="Transaction value")
-    date: date = Field(..., description="Transaction date")
-    filing_date: Optional[date] = Field(None, description="Filing date")
+    date: dt.date = Field(..., description="Transaction date")
+    filing_date: Optional[dt.date] = Field(None, description="Filing date")
 
     model_config = {
         "arbitrary_types_allowed": True
@@ -287,7 +283,7 @@ class OptionQuote(BaseModel):
 class OptionChain(BaseModel):
     """Model for an option chain."""
 
-    expiration_date: date = Field(..., description="Expiration date")
+    expiration_date: dt.date = Field(..., description="Expiration date")
     calls: List[OptionQuote] = Field(..., description="Call options")
     puts: List[OptionQuote] = Field(..., description="Put options")
 
@@ -302,7 +298,7 @@ class NewsItem(BaseModel):
     title: str = Field(..., description="News title")
     publisher: str = Field(..., description="News publisher")
     link: str = Field(..., description="News link")
-    publish_date: datetime = Field(..., description="Publish date")
+    publish_date: dt.datetime = Field(..., description="Publish date")
     summary: Optional[str] = Field(None, description="News summary")
     news_type: Optional[str] = Field(None, description="News type", alias="type")
     related_tickers: Optional[List[str]] = Field(None, description="Related tickers")
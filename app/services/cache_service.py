@@ -1,17 +1,215 @@
 """Service for managing application caching."""
 import logging
-from datetime import datetime, timedelta, time, timezone
-from typing import Any, Callable, Optional, Tuple
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+import orjson
 import redis
-import pickle
+import redis.asyncio
 import hashlib
+import zlib
 import asyncio
+import threading
 from functools import wraps
+from time import monotonic, time
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# One-byte format marker prefixed to every cached payload. Anything else,
+# including pickled entries from older versions, is treated as a cache miss
+# and never unpickled.
+_ORJSON_FORMAT = b"J"
+
+# Raise TypeError for types orjson would otherwise convert (str/int/dict
+# subclasses, datetimes, dataclasses). NumPy values and non-str keys are
+# rejected by default. Tuples and NaN/Infinity still encode, as lists and
+# null, so _serialize checks the round trip before caching the value.
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_SUBCLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
+_SECONDS_PER_DAY = 24 * 60 * 60
+
+# Set by stale_fallback_decorator when it serves a stale copy, so the cache
+# decorator above it can store that result briefly instead of as fresh data
+_stale_result_served: ContextVar[bool] = ContextVar("stale_result_served", default=False)
+
+# Settings read on every cached call, frozen once at import so the hot path
+# loads a module global instead of going through the pydantic model
+_CACHE_PREFIX = settings.CACHE_PREFIX
+_CACHE_LOCAL_TTL = settings.CACHE_LOCAL_TTL
+_CACHE_LOCAL_MAXSIZE = settings.CACHE_LOCAL_MAXSIZE
+_CACHE_MIDNIGHT_JITTER = settings.CACHE_MIDNIGHT_JITTER
+_CACHE_STALE_RETRY_TTL = settings.CACHE_STALE_RETRY_TTL
+
+# Number of UNLINK commands sent per pipeline round trip when clearing a namespace
+_UNLINK_BATCH_SIZE = 500
+
+
+def seconds_until_midnight() -> int:
+    """
+    Calculate seconds until midnight UTC.
+
+    Unix time has no leap seconds, so every UTC day is exactly 86400 seconds
+    and the remainder gives the position within the current day.
+
+    Returns:
+        int: Seconds until midnight UTC, between 1 and 86400
+    """
+    return _SECONDS_PER_DAY - int(time()) % _SECONDS_PER_DAY
+
+
+def seconds_until_refresh(key: str) -> int:
+    """
+    Calculate seconds until a key's daily refresh after midnight UTC.
+
+    Each key refreshes at midnight plus a fixed offset below
+    CACHE_MIDNIGHT_JITTER, so daily entries expire spread over that window
+    instead of all at once. The offset comes from a CRC32 of the key, which
+    unlike hash() is the same in every worker process.
+
+    Args:
+        key: The cache key
+
+    Returns:
+        int: Seconds until the key's next refresh
+    """
+    offset = zlib.crc32(key.encode()) % _CACHE_MIDNIGHT_JITTER if _CACHE_MIDNIGHT_JITTER > 0 else 0
+    return seconds_until_midnight() + offset
+
+
+def _serialize(value: Any) -> Optional[bytes]:
+    """
+    Serialize a value for Redis.
+
+    Only JSON-shaped values, which is what the cleaned endpoint results are,
+    are stored. Anything that would not decode to an equal value (tuples,
+    NaN, DataFrames and other unsupported types) is not cached at all, so
+    a cache hit always has the same shape as the result that populated it.
+
+    Args:
+        value: The value to store
+
+    Returns:
+        Optional[bytes]: Format marker followed by the encoded value, or None
+            if the value cannot be cached
+    """
+    try:
+        encoded = orjson.dumps(value, option=_ORJSON_OPTIONS)
+    except TypeError:
+        return None
+
+    # Tuples decode as lists and NaN as None, neither of which compares equal
+    if orjson.loads(encoded) != value:
+        return None
+
+    return _ORJSON_FORMAT + encoded
+
+
+def _deserialize(data: bytes) -> Tuple[bool, Any]:
+    """
+    Deserialize a value read from Redis.
+
+    Args:
+        data: Stored bytes
+
+    Returns:
+        Tuple[bool, Any]: (True, value), or (False, None) for any other format
+    """
+    marker, payload = data[:1], data[1:]
+    if marker == _ORJSON_FORMAT:
+        return True, orjson.loads(payload)
+    return False, None
+
+
+class RedisGetBatcher:
+    """
+    Coalesce concurrent Redis GETs into MGET commands.
+
+    Lookups issued within the same short window are sent together as one
+    MGET, so N concurrent cache reads cost one round trip instead of N.
+    Concurrent reads of the same key share a single slot in the batch.
+    """
+
+    def __init__(self, client: redis.asyncio.Redis, max_batch_size: int, window_ms: float):
+        """
+        Initialize the batcher.
+
+        Args:
+            client: Async Redis client
+            max_batch_size: Number of distinct keys that triggers an immediate flush
+            window_ms: Milliseconds to wait for more keys; 0 flushes on the next loop iteration
+        """
+        self._client = client
+        self._max_batch_size = max_batch_size
+        self._window = window_ms / 1000
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Get the raw value of a key as part of the next batch.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            Optional[bytes]: Stored bytes, or None if the key does not exist
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            if self._window > 0:
+                self._flush_handle = loop.call_later(self._window, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Send the pending keys as one MGET."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, {}
+        if pending:
+            # Keep a reference so the task is not garbage collected mid-flight
+            task = asyncio.ensure_future(self._execute(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, pending: Dict[str, List[asyncio.Future]]) -> None:
+        """
+        Run one MGET and resolve the waiting lookups.
+
+        Args:
+            pending: Waiting futures keyed by cache key
+        """
+        keys = list(pending)
+        try:
+            values = await self._client.mget(keys)
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for key, value in zip(keys, values):
+            for future in pending[key]:
+                if not future.done():
+                    future.set_result(value)
+
 
 class CacheService:
     """
@@ -24,6 +222,16 @@ class CacheService:
     _instance = None
     redis_client = None
 
+    # Non-blocking client for coroutines, backed by one process-wide pool
+    async_redis_client: Optional[redis.asyncio.Redis] = None
+
+    # Coalesces concurrent async reads into MGETs
+    _get_batcher: Optional[RedisGetBatcher] = None
+
+    # Process-local L1 cache in front of Redis: key -> (expires_at, value)
+    _local_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    _local_lock = threading.Lock()
+
     def __new__(cls):
         """Implement singleton pattern."""
         if cls._instance is None:
@@ -40,7 +248,7 @@ class CacheService:
                 port=settings.REDIS_PORT,
                 db=settings.REDIS_DB,
                 password=settings.REDIS_PASSWORD,
-                decode_responses=False  # We want binary data for pickle
+                decode_responses=False  # Cached payloads are binary
             )
             # Test connection
             cls.redis_client.ping()
@@ -48,6 +256,25 @@ class CacheService:
         except redis.ConnectionError as e:
             logger.warning(f"Could not connect to Redis: {str(e)}. Caching will be disabled.")
             cls.redis_client = None
+            return
+
+        cls.async_redis_client = redis.asyncio.Redis(
+            connection_pool=redis.asyncio.ConnectionPool(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.REDIS_DB,
+                password=settings.REDIS_PASSWORD,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                socket_timeout=5,
+                socket_connect_timeout=5,
+                socket_keepalive=True
+            )
+        )
+        cls._get_batcher = RedisGetBatcher(
+            cls.async_redis_client,
+            max_batch_size=settings.CACHE_BATCH_MAX_SIZE,
+            window_ms=settings.CACHE_BATCH_WINDOW_MS
+        )
 
     @classmethod
     def is_available(cls) -> bool:
@@ -93,7 +320,7 @@ class CacheService:
         key_str = ":".join(key_parts)
         hashed = hashlib.md5(key_str.encode()).hexdigest()
 
-        return f"{settings.CACHE_PREFIX}:{prefix}:{hashed}"
+        return f"{_CACHE_PREFIX}:{prefix}:{hashed}"
 
     @classmethod
     def set(
@@ -119,8 +346,11 @@ class CacheService:
             return False
 
         try:
-            # Serialize the value
-            serialized = pickle.dumps(value)
+            # Serialize the value, skipping values that are not JSON-shaped
+            serialized = _serialize(value)
+            if serialized is None:
+                logger.debug(f"Not caching non-JSON value for {key}")
+                return False
 
             # Set the value
             if nx:
@@ -161,13 +391,118 @@ class CacheService:
                 return False, None
 
             # Deserialize the value
-            deserialized = pickle.loads(value)
-            return True, deserialized
+            return _deserialize(value)
+
+        except Exception as e:
+            logger.error(f"Error getting cache key {key}: {str(e)}")
+            return False, None
+
+    @classmethod
+    async def get_async(cls, key: str) -> Tuple[bool, Any]:
+        """
+        Get a value from the cache without blocking the event loop.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            Tuple[bool, Any]: A tuple containing a success flag and the value
+                              (True, value) if successful, (False, None) otherwise
+        """
+        if cls._get_batcher is None:
+            return False, None
+
+        try:
+            value = await cls._get_batcher.get(key)
+
+            if value is None:
+                return False, None
+
+            return _deserialize(value)
 
         except Exception as e:
             logger.error(f"Error getting cache key {key}: {str(e)}")
             return False, None
 
+    @classmethod
+    async def set_async(cls, key: str, value: Any, expire: Optional[int] = None) -> bool:
+        """
+        Set a value in the cache without blocking the event loop.
+
+        Args:
+            key: The cache key
+            value: The value to store
+            expire: Expiration time in seconds, or None for no expiration
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if cls.async_redis_client is None:
+            return False
+
+        # Skip values that are not JSON-shaped
+        serialized = _serialize(value)
+        if serialized is None:
+            logger.debug(f"Not caching non-JSON value for {key}")
+            return False
+
+        try:
+            # Store the value and its expiration in a single command
+            await cls.async_redis_client.set(key, serialized, ex=expire)
+            return True
+
+        except Exception as e:
+            logger.error(f"Error setting cache key {key}: {str(e)}")
+            return False
+
+    @classmethod
+    def get_local(cls, key: str) -> Tuple[bool, Any]:
+        """
+        Get a value from the process-local cache.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            Tuple[bool, Any]: (True, value) on a fresh hit, (False, None) otherwise
+        """
+        with cls._local_lock:
+            entry = cls._local_cache.get(key)
+            if entry is None:
+                return False, None
+
+            expires_at, value = entry
+            if expires_at <= monotonic():
+                del cls._local_cache[key]
+                return False, None
+
+            cls._local_cache.move_to_end(key)
+            return True, value
+
+    @classmethod
+    def set_local(cls, key: str, value: Any, expire: Optional[int] = None) -> None:
+        """
+        Set a value in the process-local cache.
+
+        The entry lives for at most CACHE_LOCAL_TTL seconds so workers do not
+        drift far from Redis, and the least recently used entries are evicted
+        beyond CACHE_LOCAL_MAXSIZE.
+
+        Args:
+            key: The cache key
+            value: The value to store
+            expire: Expiration time in seconds of the backing Redis entry
+        """
+        ttl = _CACHE_LOCAL_TTL if expire is None else min(expire, _CACHE_LOCAL_TTL)
+        if ttl <= 0:
+            return
+
+        with cls._local_lock:
+            cls._local_cache[key] = (monotonic() + ttl, value)
+            cls._local_cache.move_to_end(key)
+            while len(cls._local_cache) > _CACHE_LOCAL_MAXSIZE:
+                cls._local_cache.popitem(last=False)
+
     @classmethod
     def delete(cls, key: str) -> bool:
         """
@@ -179,6 +514,9 @@ class CacheService:
         Returns:
             bool: True if successful, False otherwise
         """
+        with cls._local_lock:
+            cls._local_cache.pop(key, None)
+
         if not cls.is_available():
             return False
 
@@ -199,19 +537,30 @@ class CacheService:
         Returns:
             int: The number of keys deleted
         """
+        # Drop the namespace from the process-local cache as well
+        local_prefix = f"{_CACHE_PREFIX}:{namespace}:"
+        with cls._local_lock:
+            for key in [key for key in cls._local_cache if key.startswith(local_prefix)]:
+                del cls._local_cache[key]
+
         if not cls.is_available():
             return 0
 
         try:
-            # Get all keys in the namespace
-            pattern = f"{settings.CACHE_PREFIX}:{namespace}:*"
-            keys = cls.redis_client.keys(pattern)
+            # Walk the namespace with SCAN rather than KEYS, and UNLINK in
+            # pipelined batches so Redis frees the values in the background
+            pattern = f"{_CACHE_PREFIX}:{namespace}:*"
+            deleted = 0
+            pipe = cls.redis_client.pipeline(transaction=False)
+            for key in cls.redis_client.scan_iter(match=pattern, count=1000):
+                pipe.unlink(key)
+                if len(pipe) >= _UNLINK_BATCH_SIZE:
+                    deleted += sum(pipe.execute())
 
-            if not keys:
-                return 0
+            if len(pipe):
+                deleted += sum(pipe.execute())
 
-            # Delete all keys
-            return cls.redis_client.delete(*keys)
+            return deleted
 
         except Exception as e:
             logger.error(f"Error clearing namespace {namespace}: {str(e)}")
@@ -230,63 +579,80 @@ class CacheService:
         Args:
             expire: Expiration time in seconds
             prefix: Prefix for the cache key, defaults to function name
-            invalidate_at_midnight: If True, invalidate at midnight UTC
+            invalidate_at_midnight: If True, invalidate shortly after midnight UTC
 
         Returns:
             Callable: A decorator function
         """
 
         def decorator(func: Callable) -> Callable:
+            # Resolve the key prefix once, at decoration time
+            key_prefix = prefix or func.__qualname__
+
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
-                if not cls.is_available():
-                    # If caching is not available, just call the function
-                    return await func(*args, **kwargs)
-
                 # Generate cache key
-                key_prefix = prefix or func.__qualname__
                 cache_key = cls.generate_key(key_prefix, *args, **kwargs)
 
-                # Try to get from cache
-                cached, value = cls.get(cache_key)
+                # Serve from the process-local cache first, skipping Redis entirely
+                cached, value = cls.get_local(cache_key)
+                if cached:
+                    logger.debug(f"Local cache hit for {cache_key}")
+                    return value
+
+                # Try Redis next, without blocking the event loop. Without
+                # Redis the process-local cache still serves repeated requests.
+                cached, value = await cls.get_async(cache_key)
                 if cached:
                     logger.debug(f"Cache hit for {cache_key}")
+                    cls.set_local(cache_key, value, expire=expire)
                     return value
 
                 # Call the function
                 logger.debug(f"Cache miss for {cache_key}")
-                result = await func(*args, **kwargs)
+                token = _stale_result_served.set(False)
+                try:
+                    result = await func(*args, **kwargs)
+                    stale = _stale_result_served.get()
+                finally:
+                    _stale_result_served.reset(token)
 
                 # Calculate expiration time
                 expiration = expire
                 if invalidate_at_midnight:
-                    # Calculate seconds until midnight UTC
-                    now = datetime.now(timezone.utc)
-                    midnight = datetime.combine(now.date() + timedelta(days=1), time(0, 0))
-                    seconds_to_midnight = (midnight - now).total_seconds()
-                    expiration = min(expire, int(seconds_to_midnight))
+                    expiration = min(expire, seconds_until_refresh(cache_key))
+
+                # A stale fallback is only kept until the next retry
+                if stale:
+                    expiration = min(expiration, _CACHE_STALE_RETRY_TTL)
 
                 # Store in cache
-                cls.set(cache_key, result, expire=expiration)
+                await cls.set_async(cache_key, result, expire=expiration)
+                cls.set_local(cache_key, result, expire=expiration)
 
                 return result
 
             @wraps(func)
             def sync_wrapper(*args, **kwargs):
-                if not cls.is_available():
-                    # If caching is not available, just call the function
-                    return func(*args, **kwargs)
-
                 # Generate cache key
-                key_prefix = prefix or func.__qualname__
                 cache_key = cls.generate_key(key_prefix, *args, **kwargs)
 
-                # Try to get from cache
-                cached, value = cls.get(cache_key)
+                # Serve from the process-local cache first, skipping Redis entirely
+                cached, value = cls.get_local(cache_key)
                 if cached:
-                    logger.debug(f"Cache hit for {cache_key}")
+                    logger.debug(f"Local cache hit for {cache_key}")
                     return value
 
+                # Try Redis next, when it is reachable. Without Redis the
+                # process-local cache still serves repeated requests.
+                redis_available = cls.is_available()
+                if redis_available:
+                    cached, value = cls.get(cache_key)
+                    if cached:
+                        logger.debug(f"Cache hit for {cache_key}")
+                        cls.set_local(cache_key, value, expire=expire)
+                        return value
+
                 # Call the function
                 logger.debug(f"Cache miss for {cache_key}")
                 result = func(*args, **kwargs)
@@ -294,14 +660,12 @@ class CacheService:
                 # Calculate expiration time
                 expiration = expire
                 if invalidate_at_midnight:
-                    # Calculate seconds until midnight UTC
-                    now = datetime.now(timezone.utc)
-                    midnight = datetime.combine(now.date() + timedelta(days=1), time(0, 0))
-                    seconds_to_midnight = (midnight - now).total_seconds()
-                    expiration = min(expire, int(seconds_to_midnight))
+                    expiration = min(expire, seconds_until_refresh(cache_key))
 
                 # Store in cache
-                cls.set(cache_key, result, expire=expiration)
+                if redis_available:
+                    cls.set(cache_key, result, expire=expiration)
+                cls.set_local(cache_key, result, expire=expiration)
 
                 return result
 
@@ -310,4 +674,55 @@ class CacheService:
                 return async_wrapper
             return sync_wrapper
 
-        return decorator
\ No newline at end of file
+        return decorator
+
+    @classmethod
+    def stale_fallback_decorator(
+            cls,
+            expire: int,
+            prefix: Optional[str] = None
+    ) -> Callable:
+        """
+        Create a decorator that serves the last good result when a call fails.
+
+        Each successful result is also kept in Redis for CACHE_STALE_TTL
+        seconds beyond the fresh expiration. If the decorated coroutine
+        raises, that stale copy is returned instead of the error. Apply it
+        beneath the regular cache decorator, so it only runs on cache misses;
+        the cache decorator then keeps a stale copy for at most
+        CACHE_STALE_RETRY_TTL seconds.
+
+        Args:
+            expire: Expiration time in seconds of the fresh cache entry
+            prefix: Prefix for the cache key, defaults to function name
+
+        Returns:
+            Callable: A decorator function
+        """
+
+        def decorator(func: Callable) -> Callable:
+            # Keep stale copies apart from the fresh entries
+            key_prefix = f"stale:{prefix or func.__qualname__}"
+            stale_expire = expire + settings.CACHE_STALE_TTL
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                cache_key = cls.generate_key(key_prefix, *args, **kwargs)
+
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    cached, value = await cls.get_async(cache_key)
+                    if not cached:
+                        raise
+
+                    logger.warning(f"Serving stale result for {cache_key} after error: {str(e)}")
+                    _stale_result_served.set(True)
+                    return value
+
+                await cls.set_async(cache_key, result, expire=stale_expire)
+                return result
+
+            return async_wrapper
+
+        return decorator
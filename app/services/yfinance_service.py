@@ -1,13 +1,42 @@
 """Service for interacting with the yfinance library."""
+import pandas as pd
 import yfinance as yf
-from typing import Any
+from typing import Any, Dict, List
 import logging
+import time
 from functools import lru_cache
+from itertools import islice
+from yfinance.data import YfData
 
+from app.core.config import settings
+from app.core.constants import ONE_DAY
 from app.core.exceptions import TickerNotFoundError, YFinanceError
+from app.services.cache_service import CacheService
 
 logger = logging.getLogger(__name__)
 
+# Lifetime of in-process memoized yfinance objects (in seconds)
+OBJECT_CACHE_TTL = 15 * 60
+
+# Yahoo quote endpoint, which accepts several comma-separated symbols per request
+QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+
+
+def ttl_bucket(ttl: int = OBJECT_CACHE_TTL) -> int:
+    """
+    Get the current time bucket for TTL-bounded memoization.
+
+    Passing the bucket as an extra argument to an lru_cache'd function
+    makes its entries expire when the bucket rolls over.
+
+    Args:
+        ttl: Bucket width in seconds
+
+    Returns:
+        int: Current time bucket
+    """
+    return int(time.time() // ttl)
+
 
 class YFinanceService:
     """
@@ -81,10 +110,28 @@ class YFinanceService:
             raise YFinanceError(f"Error initializing search for {query}: {str(e)}")
 
     @staticmethod
-    def get_sector(sector: str) -> yf.Sector:
+    @lru_cache(maxsize=32)
+    def _get_sector_cached(sector: str, bucket: int) -> yf.Sector:
+        """
+        Build a yfinance Sector object, memoized per time bucket.
+
+        Args:
+            sector: The sector identifier
+            bucket: Time bucket from ttl_bucket()
+
+        Returns:
+            yf.Sector: A yfinance Sector object
+        """
+        return yf.Sector(sector)
+
+    @classmethod
+    def get_sector(cls, sector: str) -> yf.Sector:
         """
         Get a yfinance Sector object.
 
+        Sector objects are reused within the same worker for up to
+        OBJECT_CACHE_TTL seconds to avoid rebuilding them per request.
+
         Args:
             sector: The sector identifier
 
@@ -95,11 +142,51 @@ class YFinanceService:
             YFinanceError: If the sector cannot be initialized
         """
         try:
-            return yf.Sector(sector)
+            return cls._get_sector_cached(sector, ttl_bucket())
         except Exception as e:
             logger.error(f"Error initializing sector {sector}: {str(e)}")
             raise YFinanceError(f"Error initializing sector {sector}: {str(e)}")
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_sector_overview_cached(sector: str, day_bucket: int) -> Dict[str, Any]:
+        """
+        Fetch a sector overview, memoized per UTC day.
+
+        Args:
+            sector: The sector identifier
+            day_bucket: Day bucket from ttl_bucket(ONE_DAY)
+
+        Returns:
+            Dict[str, Any]: The sector overview
+        """
+        return YFinanceService.get_sector(sector).overview or {}
+
+    @classmethod
+    def get_sector_overview(cls, sector: str) -> Dict[str, Any]:
+        """
+        Get the overview of a sector.
+
+        The parsed overview is shared by all callers in the worker until
+        midnight UTC, so it must be treated as read-only.
+
+        Args:
+            sector: The sector identifier
+
+        Returns:
+            Dict[str, Any]: The sector overview
+
+        Raises:
+            YFinanceError: If the overview cannot be retrieved
+        """
+        try:
+            return cls._get_sector_overview_cached(sector, ttl_bucket(ONE_DAY))
+        except YFinanceError:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting overview for sector {sector}: {str(e)}")
+            raise YFinanceError(f"Error getting overview for sector {sector}: {str(e)}")
+
     @staticmethod
     def get_industry(industry: str) -> yf.Industry:
         """
@@ -161,6 +248,37 @@ class YFinanceService:
             logger.error(f"Error getting {attribute} for ticker {ticker}: {str(e)}")
             raise YFinanceError(f"Error getting {attribute} for ticker {ticker}: {str(e)}")
 
+    @classmethod
+    @CacheService.cache_decorator(expire=settings.CACHE_1_DAY, prefix="quote_batch")
+    def get_quote_batch(cls, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get quote data for several tickers in a single Yahoo request.
+
+        The request goes through yfinance's shared session, so it reuses
+        the same cookies and crumb as the Ticker objects. Results are cached
+        per symbol list, so every endpoint variant needing the same quotes
+        shares one upstream fetch.
+
+        Args:
+            symbols: The ticker symbols
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Quote rows keyed by ticker symbol
+
+        Raises:
+            YFinanceError: If there is an error fetching the quotes
+        """
+        try:
+            data = YfData().get_raw_json(
+                QUOTE_URL,
+                params={"symbols": ",".join(symbols), "formatted": "false"}
+            )
+            rows = (data.get("quoteResponse") or {}).get("result") or []
+            return {row["symbol"]: row for row in rows if "symbol" in row}
+        except Exception as e:
+            logger.error(f"Error getting quotes for {', '.join(symbols)}: {str(e)}")
+            raise YFinanceError(f"Error getting quotes for {', '.join(symbols)}: {str(e)}")
+
     @classmethod
     def get_market_data(cls, market: str, attribute: str) -> Any:
         """
@@ -227,6 +345,61 @@ class YFinanceService:
             logger.error(f"Error getting {attribute} for sector {sector}: {str(e)}")
             raise YFinanceError(f"Error getting {attribute} for sector {sector}: {str(e)}")
 
+    @classmethod
+    def get_sector_top(cls, sector: str, attribute: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Get the first entries of a sector's top list attribute.
+
+        Only the requested entries are kept, so the rest of the list is never
+        converted or serialized. The entries are returned as records, see
+        top_list_records.
+
+        Args:
+            sector: The sector identifier
+            attribute: The yfinance Sector top list attribute (top_companies, top_etfs, ...)
+            limit: Maximum number of entries to return
+
+        Returns:
+            List[Dict[str, Any]]: The first entries of the attribute as records
+
+        Raises:
+            YFinanceError: If there is an error accessing the attribute
+        """
+        data = cls.get_sector_data(sector, attribute)
+
+        # Keep only the requested entries before converting them
+        if isinstance(data, pd.DataFrame):
+            data = data.head(limit)
+        elif isinstance(data, dict):
+            data = dict(islice(data.items(), limit))
+        elif data is not None:
+            data = list(data)[:limit]
+
+        return cls.top_list_records(data)
+
+    @staticmethod
+    def top_list_records(data: Any) -> List[Dict[str, Any]]:
+        """
+        Convert a yfinance top list attribute to a list of records.
+
+        Newer yfinance versions expose Sector.top_companies as a DataFrame
+        indexed by symbol, and top_etfs / top_mutual_funds as symbol-to-name
+        dicts; iterating either directly would yield column names or keys.
+
+        Args:
+            data: The top list attribute value
+
+        Returns:
+            List[Dict[str, Any]]: Records, with the symbol as a field
+        """
+        if data is None:
+            return []
+        if isinstance(data, pd.DataFrame):
+            return data.reset_index().to_dict(orient="records")
+        if isinstance(data, dict):
+            return [{"symbol": symbol, "name": name} for symbol, name in data.items()]
+        return list(data)
+
     @classmethod
     def get_industry_data(cls, industry: str, attribute: str) -> Any:
         """
@@ -290,4 +463,131 @@ class YFinanceService:
             if isinstance(e, TickerNotFoundError):
                 raise
             logger.error(f"Error getting history for ticker {ticker}: {str(e)}")
-            raise YFinanceError(f"Error getting history for ticker {ticker}: {str(e)}")
\ No newline at end of file
+            raise YFinanceError(f"Error getting history for ticker {ticker}: {str(e)}")
+
+    @staticmethod
+    @lru_cache(maxsize=100)
+    def _get_close_history_cached(ticker: str, period: str, bucket: int) -> Any:
+        """
+        Download daily closing prices, memoized per time bucket.
+
+        Args:
+            ticker: The ticker symbol
+            period: Time period to download
+            bucket: Time bucket from ttl_bucket()
+
+        Returns:
+            pd.Series: Daily closing prices as float64
+        """
+        ticker_obj = YFinanceService.get_ticker(ticker)
+        history = ticker_obj.history(period=period, interval="1d", actions=False, prepost=False)
+
+        if history.empty:
+            logger.warning(f"No historical data found for ticker {ticker}")
+            return pd.Series(dtype="float64")
+
+        # Keep float64: float32 holds only ~7 significant digits, which
+        # loses the cents on prices of 100,000 and above
+        return history["Close"].astype("float64")
+
+    @classmethod
+    def get_ticker_close_history(
+            cls,
+            ticker: str,
+            period: str = "1mo"
+    ) -> Any:
+        """
+        Get daily closing prices for a ticker.
+
+        Skips dividend/split columns and pre/post-market rows, and keeps only
+        the Close column, for callers that do not need full OHLCV data.
+        Series are shared by all callers in the worker (e.g. the ^GSPC
+        benchmark across sectors) for up to OBJECT_CACHE_TTL seconds, so
+        they must be treated as read-only.
+
+        Args:
+            ticker: The ticker symbol
+            period: Time period to download (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+
+        Returns:
+            pd.Series: Daily closing prices as float64, empty if there is no data
+
+        Raises:
+            TickerNotFoundError: If the ticker cannot be found
+            YFinanceError: If there is an error retrieving the history
+        """
+        try:
+            return cls._get_close_history_cached(ticker, period, ttl_bucket())
+        except Exception as e:
+            if isinstance(e, TickerNotFoundError):
+                raise
+            logger.error(f"Error getting close history for ticker {ticker}: {str(e)}")
+            raise YFinanceError(f"Error getting close history for ticker {ticker}: {str(e)}")
+
+    @classmethod
+    @CacheService.cache_decorator(expire=settings.CACHE_1_DAY, prefix="multi_history")
+    def get_multi_history(
+            cls,
+            tickers: List[str],
+            period: str = "1mo",
+            interval: str = "1d",
+            **kwargs
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get historical data for several tickers in one batched download.
+
+        Results are cached per symbol list and period. The download is
+        returned as plain records so it can be stored in the JSON cache.
+
+        Args:
+            tickers: The ticker symbols
+            period: Time period to download (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+            interval: Data interval (1m, 2m, 5m, 15m, 30m, 60m, 90m, 1h, 1d, 5d, 1wk, 1mo, 3mo)
+            **kwargs: Additional arguments to pass to yfinance.download()
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Per ticker, one record per row with
+                an ISO "Date" and the price fields, missing values as None
+
+        Raises:
+            YFinanceError: If there is an error retrieving the history
+        """
+        try:
+            history = yf.download(
+                tickers,
+                period=period,
+                interval=interval,
+                group_by="ticker",
+                threads=True,
+                progress=False,
+                **kwargs
+            )
+            return cls._multi_history_records(history)
+        except Exception as e:
+            logger.error(f"Error getting history for tickers {', '.join(tickers)}: {str(e)}")
+            raise YFinanceError(f"Error getting history for tickers {', '.join(tickers)}: {str(e)}")
+
+    @staticmethod
+    def _multi_history_records(history: pd.DataFrame) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Convert a batched download with (ticker, field) columns to records.
+
+        Args:
+            history: Historical data from yfinance.download(group_by="ticker")
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Records per ticker symbol
+        """
+        if history.empty:
+            return {}
+
+        # Format the shared index once, then box each ticker's values as
+        # Python scalars with NaN turned into None
+        dates = [timestamp.isoformat() for timestamp in history.index]
+        records = {}
+        for ticker in history.columns.get_level_values(0).unique():
+            frame = history[ticker]
+            rows = frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+            records[ticker] = [{"Date": date, **row} for date, row in zip(dates, rows)]
+
+        return records
@@ -4,19 +4,42 @@ This module provides decorators for endpoint functions, including
 caching, validation, error handling, and performance tracking.
 """
 import functools
+import hashlib
 import inspect
 import logging
 import time
+from datetime import datetime, timezone
 from typing import Callable, Optional
 
+from fastapi import Request, Response, status
+from fastapi.encoders import jsonable_encoder
+
 from app.core.config import settings
 from app.core.exceptions import YFinanceError, TickerNotFoundError
 from app.services.metrics_service import MetricsService
-from app.services.cache_service import CacheService
-from app.utils.formatters import format_response
+from app.services.cache_service import CacheService, seconds_until_refresh
+from app.utils.formatters import ORJSONResponse, format_response
+from app.utils.yfinance_data_manager import (
+    _extract_identifier,
+    _is_empty_result,
+    process_yfinance_output
+)
 
 logger = logging.getLogger(__name__)
 
+# Cache expirations (in seconds) keyed by duration name
+CACHE_EXPIRATIONS = {
+    "30_minutes": settings.CACHE_30_MINUTES,
+    "1_hour": settings.CACHE_1_HOUR,
+    "1_day": settings.CACHE_1_DAY,
+    "1_week": settings.CACHE_1_WEEK,
+    "1_month": settings.CACHE_1_MONTH,
+    "3_months": settings.CACHE_3_MONTHS,
+}
+
+# Read on every conditional request, so frozen once at import
+_CACHE_MIDNIGHT_JITTER = settings.CACHE_MIDNIGHT_JITTER
+
 
 def response_formatter(
         format_type: str = 'default',
@@ -161,12 +184,12 @@ def performance_tracker() -> Callable:
     metrics_service = MetricsService()
 
     def decorator(func: Callable) -> Callable:
+        # Resolve the endpoint name and path once, at decoration time
+        endpoint_name = func.__name__
+        path = f"/v1/{endpoint_name.replace('get_', '').replace('_', '/')}"
+
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
-            # Get endpoint name and path
-            endpoint_name = func.__name__
-            path = f"/v1/{endpoint_name.replace('get_', '').replace('_', '/')}"
-
             # Start timer
             start_time = time.time()
             error = False
@@ -191,10 +214,6 @@ def performance_tracker() -> Callable:
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            # Get endpoint name and path
-            endpoint_name = func.__name__
-            path = f"/v1/{endpoint_name.replace('get_', '').replace('_', '/')}"
-
             # Start timer
             start_time = time.time()
             error = False
@@ -252,10 +271,13 @@ def custom_cache(
         # Build cache namespace
         cache_ns = namespace or f"yfinance:{func_name}"
 
+        # Read the toggle once, at decoration time
+        cache_enabled = settings.CACHE_ENABLED
+
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
             # Skip caching if disabled
-            if not settings.CACHE_ENABLED:
+            if not cache_enabled:
                 return await func(*args, **kwargs)
 
             # Generate cache key
@@ -265,10 +287,17 @@ def custom_cache(
                 **{k: v for k, v in kwargs.items() if k != 'request' and k != 'response'}
             )
 
-            # Try to get from cache
-            cached, value = cache_service.get(cache_key)
+            # Serve from the process-local cache first, skipping Redis entirely
+            cached, value = cache_service.get_local(cache_key)
+            if cached:
+                logger.debug(f"Local cache hit for {cache_key}")
+                return value
+
+            # Try Redis next, without blocking the event loop
+            cached, value = await cache_service.get_async(cache_key)
             if cached:
                 logger.debug(f"Cache hit for {cache_key}")
+                cache_service.set_local(cache_key, value, expire=expire)
                 return value
 
             # Call the function
@@ -278,22 +307,21 @@ def custom_cache(
             # Calculate expiration time
             expiration = expire
             if invalidate_at_midnight:
-                # Calculate seconds until midnight UTC
-                from app.core.cache import calculate_seconds_until_midnight
-                seconds_to_midnight = calculate_seconds_until_midnight()
-                expiration = min(expire, seconds_to_midnight)
+                # Expire at this key's refresh slot just after midnight UTC
+                expiration = min(expire, seconds_until_refresh(cache_key))
 
                 logger.debug(f"Setting expiration to {expiration}s (midnight invalidation)")
 
             # Store in cache
-            cache_service.set(cache_key, result, expire=expiration)
+            await cache_service.set_async(cache_key, result, expire=expiration)
+            cache_service.set_local(cache_key, result, expire=expiration)
 
             return result
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
             # Skip caching if disabled
-            if not settings.CACHE_ENABLED:
+            if not cache_enabled:
                 return func(*args, **kwargs)
 
             # Generate cache key
@@ -316,10 +344,8 @@ def custom_cache(
             # Calculate expiration time
             expiration = expire
             if invalidate_at_midnight:
-                # Calculate seconds until midnight UTC
-                from app.core.cache import calculate_seconds_until_midnight
-                seconds_to_midnight = calculate_seconds_until_midnight()
-                expiration = min(expire, seconds_to_midnight)
+                # Expire at this key's refresh slot just after midnight UTC
+                expiration = min(expire, seconds_until_refresh(cache_key))
 
                 logger.debug(f"Setting expiration to {expiration}s (midnight invalidation)")
 
@@ -396,4 +422,180 @@ def endpoint_decorator(
 
         return decorated
 
-    return decorator
\ No newline at end of file
+    return decorator
+
+
+def yf_endpoint(
+        cache_duration: Optional[str] = None,
+        invalidate_at_midnight: bool = False,
+        format_type: str = 'default'
+) -> Callable:
+    """
+    Fused decorator for async endpoint functions.
+
+    Behaves like stacking ``performance_tracker``, ``error_handler``, a cache
+    decorator, ``clean_yfinance_data`` and ``response_formatter``, but runs
+    the whole pipeline in a single coroutine with one try/except instead of
+    five nested wrappers.
+
+    Args:
+        cache_duration: Cache duration (30_minutes, 1_hour, 1_day, 1_week, 1_month, 3_months)
+        invalidate_at_midnight: Whether to invalidate at midnight UTC
+        format_type: Response format type (default, compact, extended)
+
+    Returns:
+        Callable: Decorator function
+    """
+    metrics_service = MetricsService()
+    expire = CACHE_EXPIRATIONS[cache_duration] if cache_duration else None
+
+    def decorator(func: Callable) -> Callable:
+        # Resolve per-endpoint constants once, at decoration time
+        endpoint_name = func.__name__
+        path = f"/v1/{endpoint_name.replace('get_', '').replace('_', '/')}"
+        key_prefix = func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            start_time = time.time()
+            error = False
+            identifier = _extract_identifier(kwargs)
+
+            try:
+                # Try to get from cache
+                cache_key = None
+                if expire is not None:
+                    cache_key = CacheService.generate_key(
+                        key_prefix,
+                        *args,
+                        **{k: v for k, v in kwargs.items() if k != 'request' and k != 'response'}
+                    )
+                    cached, value = CacheService.get_local(cache_key)
+                    if cached:
+                        logger.debug(f"Local cache hit for {cache_key}")
+                        return value
+
+                    # Try Redis next, without blocking the event loop
+                    cached, value = await CacheService.get_async(cache_key)
+                    if cached:
+                        logger.debug(f"Cache hit for {cache_key}")
+                        CacheService.set_local(cache_key, value, expire=expire)
+                        return value
+
+                # Call the function and format the response
+                result = await func(*args, **kwargs)
+                result = format_response(result, kwargs.get('format') or format_type)
+
+                # Clean the result to make it JSON serializable
+                if _is_empty_result(result):
+                    if identifier:
+                        raise TickerNotFoundError(identifier)
+                    result = []
+                else:
+                    result = process_yfinance_output(result)
+
+                # Store in cache; the local layer works without Redis
+                if cache_key is not None:
+                    expiration = expire
+                    if invalidate_at_midnight:
+                        expiration = min(expire, seconds_until_refresh(cache_key))
+                    await CacheService.set_async(cache_key, result, expire=expiration)
+                    CacheService.set_local(cache_key, result, expire=expiration)
+
+                return result
+            except (TickerNotFoundError, YFinanceError):
+                error = True
+                raise
+            except Exception as e:
+                error = True
+                logger.exception(f"Error in {endpoint_name}: {str(e)}")
+
+                # Check for common yfinance errors
+                if "No data found" in str(e) and identifier:
+                    raise TickerNotFoundError(identifier)
+
+                raise YFinanceError(f"Error processing request: {str(e)}")
+            finally:
+                metrics_service.record_endpoint_call(
+                    endpoint_name=endpoint_name,
+                    path=path,
+                    response_time=time.time() - start_time,
+                    error=error
+                )
+
+        return wrapper
+
+    return decorator
+
+
+def orjson_response() -> Callable:
+    """
+    Decorator returning an endpoint's result as a prebuilt ORJSONResponse.
+
+    FastAPI does not validate or re-encode Response objects, so results
+    that are already JSON-ready (cleaned yfinance output, cached payloads)
+    skip the response_model validation and jsonable_encoder passes. The
+    route's response_model is still used for the OpenAPI schema.
+
+    Returns:
+        Callable: Decorator function
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            result = await func(*args, **kwargs)
+            if isinstance(result, Response):
+                return result
+            return ORJSONResponse(content=result)
+
+        return async_wrapper
+
+    return decorator
+
+
+def conditional_etag() -> Callable:
+    """
+    Decorator adding conditional GET support to an endpoint.
+
+    The ETag is derived from the request path, its query parameters and the
+    UTC date. The date rolls over CACHE_MIDNIGHT_JITTER seconds after
+    midnight, once every daily cache entry has refreshed, so a body cached
+    before midnight is never served under the new day's ETag.
+    When the client's If-None-Match header matches, a 304 response is
+    returned without calling the endpoint. The decorated endpoint must
+    declare a ``request: Request`` parameter.
+
+    Returns:
+        Callable: Decorator function
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            request: Request = kwargs['request']
+
+            # Build the ETag from the request identity and the cache day
+            query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+            cache_day = datetime.fromtimestamp(time.time() - _CACHE_MIDNIGHT_JITTER, timezone.utc)
+            day = cache_day.date().isoformat()
+            digest = hashlib.blake2b(
+                f"{request.url.path}?{query}|{day}".encode(),
+                digest_size=16
+            ).hexdigest()
+            etag = f'"{digest}"'
+
+            # Short-circuit if the client already has this representation
+            if_none_match = request.headers.get("if-none-match")
+            if if_none_match:
+                client_etags = {tag.strip() for tag in if_none_match.split(",")}
+                client_etags |= {tag[2:] for tag in client_etags if tag.startswith("W/")}
+                if etag in client_etags or "*" in client_etags:
+                    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+            result = await func(*args, **kwargs)
+            return ORJSONResponse(content=jsonable_encoder(result), headers={"ETag": etag})
+
+        return async_wrapper
+
+    return decorator
@@ -9,8 +9,10 @@ from datetime import datetime, date, timezone
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Union, Hashable
 
+import orjson
 import pandas as pd
 import numpy as np
+from fastapi.responses import JSONResponse
 
 from app.core.utils import format_datetime, format_decimal
 
@@ -503,6 +505,26 @@ def to_json(data: Any, indent: Optional[int] = None) -> str:
     return json.dumps(data, default=json_encoder, indent=indent, ensure_ascii=False)
 
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, falling back to json_encoder for other types."""
+
+    def render(self, content: Any) -> bytes:
+        """
+        Render content to JSON bytes.
+
+        Args:
+            content: Response content
+
+        Returns:
+            bytes: Encoded JSON body
+        """
+        return orjson.dumps(
+            content,
+            default=json_encoder,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
 def to_csv(df: pd.DataFrame) -> str:
     """
     Convert DataFrame to CSV string.
@@ -26,6 +26,13 @@ from app.core.exceptions import ValidationError
 
 logger = logging.getLogger(__name__)
 
+# 1-5 uppercase letters or digits, optionally followed by a dot and 1-2 letters
+# or a hyphen and additional characters for international tickers
+_TICKER_PATTERN = re.compile(r'^[A-Z0-9]{1,5}(\.[A-Z]{1,2}|-[A-Z0-9]+)?$')
+
+# Sector and industry keys: only lowercase letters, numbers, and underscores
+_IDENTIFIER_PATTERN = re.compile(r'^[a-z0-9_]+$')
+
 
 def validate_ticker(ticker: str) -> str:
     """
@@ -47,11 +54,8 @@ def validate_ticker(ticker: str) -> str:
     if not ticker:
         raise ValidationError("Ticker symbol cannot be empty")
 
-    # Basic validation: 1-5 uppercase letters, optionally followed by a dot and 1-2 letters
-    # or a hyphen and additional characters for international tickers
-    pattern = r'^[A-Z0-9]{1,5}(\.[A-Z]{1,2}|-[A-Z0-9]+)?$'
-
-    if not re.match(pattern, ticker):
+    # Basic validation against the precompiled ticker pattern
+    if not _TICKER_PATTERN.match(ticker):
         raise ValidationError(
             f"Invalid ticker symbol: {ticker}. "
             "Ticker should be 1-5 uppercase letters, optionally followed by a dot and 1-2 letters."
@@ -111,9 +115,7 @@ def validate_sector(sector: str) -> str:
         raise ValidationError("Sector identifier cannot be empty")
 
     # Basic validation: only letters, numbers, and underscores
-    pattern = r'^[a-z0-9_]+$'
-
-    if not re.match(pattern, sector):
+    if not _IDENTIFIER_PATTERN.match(sector):
         raise ValidationError(
             f"Invalid sector identifier: {sector}. "
             "Sector should contain only letters, numbers, and underscores."
@@ -143,9 +145,7 @@ def validate_industry(industry: str) -> str:
         raise ValidationError("Industry identifier cannot be empty")
 
     # Basic validation: only letters, numbers, and underscores
-    pattern = r'^[a-z0-9_]+$'
-
-    if not re.match(pattern, industry):
+    if not _IDENTIFIER_PATTERN.match(industry):
         raise ValidationError(
             f"Invalid industry identifier: {industry}. "
             "Industry should contain only letters, numbers, and underscores."
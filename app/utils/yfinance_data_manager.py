@@ -6,6 +6,8 @@ returned by YFinance to ensure it is JSON serializable and well-formatted.
 import functools
 import inspect
 import logging
+import math
+from collections.abc import Mapping
 from datetime import datetime, date, timezone
 from typing import Any, Callable, Dict, List, Optional
 
@@ -17,6 +19,9 @@ from app.services.metrics_service import MetricsService
 
 logger = logging.getLogger(__name__)
 
+# Built-in scalar types that are already JSON serializable as they are
+_JSON_SCALAR_TYPES = frozenset({str, int, bool})
+
 
 def clean_yfinance_data(func: Callable) -> Callable:
     """
@@ -161,9 +166,12 @@ def process_yfinance_output(data: Any) -> Any:
     Returns:
         Any: Processed data that is JSON serializable
     """
-    # Handle None
-    if data is None:
-        return None
+    # Fast path for plain values, which make up most of the leaves
+    data_type = type(data)
+    if data is None or data_type in _JSON_SCALAR_TYPES:
+        return data
+    if data_type is float:
+        return data if math.isfinite(data) else None
 
     # Handle pandas DataFrame
     if isinstance(data, pd.DataFrame):
@@ -175,14 +183,13 @@ def process_yfinance_output(data: Any) -> Any:
         else:
             df = data.copy()
 
-        # Convert to records and process each value
-        records = []
-        for _, row in df.iterrows():
-            record = {}
-            for col_name, value in row.items():
-                record[str(col_name)] = process_yfinance_output(value)
-            records.append(record)
-        return records
+        # Convert to records and process each value. itertuples yields plain
+        # tuples, so no Series is built (or dtype upcast) per row.
+        keys = [str(col_name) for col_name in df.columns]
+        return [
+            {key: process_yfinance_output(value) for key, value in zip(keys, row)}
+            for row in df.itertuples(index=False, name=None)
+        ]
 
     # Handle pandas Series
     if isinstance(data, pd.Series):
@@ -211,10 +218,10 @@ def process_yfinance_output(data: Any) -> Any:
     if isinstance(data, np.ndarray):
         return [process_yfinance_output(item) for item in data]
 
-    # Handle lists and dictionaries recursively
+    # Handle lists and mappings (including read-only ones) recursively
     if isinstance(data, list):
         return [process_yfinance_output(item) for item in data]
-    if isinstance(data, dict):
+    if isinstance(data, Mapping):
         return {str(k): process_yfinance_output(v) for k, v in data.items()}
 
     # Handle sets